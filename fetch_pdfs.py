@@ -3,14 +3,24 @@
 
 from __future__ import annotations
 
+import base64
+import gzip
+import http.client
+import os
+import queue
+import random
 import shutil
 import tempfile
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import lru_cache
 from html import unescape
+from html.parser import HTMLParser
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional, Tuple
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
 
 import re
 import unicodedata
@@ -21,20 +31,20 @@ import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext
 
 import importlib.util
-from urllib.parse import quote_plus
-from urllib.request import Request, urlopen
+import json
+from http.cookiejar import Cookie, CookieJar
+from urllib.error import HTTPError
+from urllib.parse import quote_plus, urlencode, urljoin, urlsplit
+from urllib.request import HTTPCookieProcessor, OpenerDirector, Request, build_opener, urlopen
 
 
 selenium_spec = importlib.util.find_spec("selenium")
 if selenium_spec is not None:
     from selenium import webdriver
-    from selenium.common.exceptions import (
-        NoSuchElementException,
-        TimeoutException,
-        WebDriverException,
-    )
+    from selenium.common.exceptions import TimeoutException, WebDriverException
     from selenium.webdriver.common.by import By
     from selenium.webdriver.firefox.options import Options as FirefoxOptions
+    from selenium.webdriver.firefox.service import Service as FirefoxService
     from selenium.webdriver.support import expected_conditions as EC
     from selenium.webdriver.support.ui import WebDriverWait
 else:  # pragma: no cover - executed only when selenium is unavailable
@@ -50,19 +60,39 @@ else:  # pragma: no cover - executed only when PyPDF2 is unavailable
     PdfReader = None  # type: ignore
 
 
-REFERENCE_LEAD_PATTERN = re.compile(r"^\s*(?:\[\d+\]|\(\d+\)|\d+[.)])\s*")
-LOOSE_REFERENCE_LEAD_PATTERN = re.compile(
-    r"^\s*\d+\s+(?=.*[A-Za-zÀ-ÖØ-öø-ÿ])"
+watchdog_spec = importlib.util.find_spec("watchdog")
+if watchdog_spec is not None:
+    from watchdog.events import FileSystemEventHandler  # type: ignore
+    from watchdog.observers import Observer  # type: ignore
+else:  # pragma: no cover - executed only when watchdog is unavailable
+    FileSystemEventHandler = object  # type: ignore
+    Observer = None  # type: ignore
+
+
+# A numbering marker ("[2]", "(2)", "2." or "2)") followed by a bare number before
+# the authors ("3 Smith"), either or both; stripped in a single substitution.
+REFERENCE_LEAD_PATTERN = re.compile(
+    r"^\s*(?:(?:\[\d+\]|\(\d+\)|\d+[.)])\s*)?(?:\d+\s+(?=.*[A-Za-zÀ-ÖØ-öø-ÿ]))?"
+)
+# Either numbering style above, checked with a single match per line.
+REFERENCE_START_PATTERN = re.compile(
+    r"\s*(?:\[\d+\]|\(\d+\)|\d+[.)]|\d+\s+(?=.*[A-Za-zÀ-ÖØ-öø-ÿ]))"
 )
 DOI_PATTERN = re.compile(r"10\.\d{4,9}/[^\s\"<>]+", re.IGNORECASE)
 URL_PATTERN = re.compile(r"https?://\S+", re.IGNORECASE)
+# The DOI alternative cannot end in TRAILING_PUNCTUATION, so a bare DOI needs no
+# clean-up after matching.
+LINK_PATTERN = re.compile(
+    r"(?P<doi>10\.\d{4,9}/[^\s\"<>]*[^\s\"<>.,);:\]'])|(?P<url>https?://\S+)",
+    re.IGNORECASE,
+)
 PAGES_PATTERN = re.compile(r"\b(\d{1,4}\s*[–-]\s*\d{1,4})\b")
 JOURNAL_BEFORE_YEAR_PATTERN = re.compile(
     r"[,;]\s*([^,;]+?)(?=[,;]\s*(?:19|20)\d{2}\b)"
 )
 
+# Lowercase substrings; "not a robot" also covers "I'm not a robot".
 CHALLENGE_KEYWORDS = (
-    "i'm not a robot",
     "not a robot",
     "unusual traffic",
     "recaptcha",
@@ -72,12 +102,23 @@ CHALLENGE_KEYWORDS = (
 
 
 SCHOLAR_BASE_URL = "https://scholar.google.com"
+SCHOLAR_QUERY_URL_PREFIX = f"{SCHOLAR_BASE_URL}/scholar?hl=en&as_sdt=0%2C5&q="
+DOI_RESOLVER_URL = "https://doi.org/"
+ARXIV_PDF_URL = "https://arxiv.org/pdf/"
+# New-style (2101.01234v2) and old-style (hep-th/9901001) arXiv identifiers.
+ARXIV_ID_PATTERN = re.compile(
+    r"\barXiv:\s*(\d{4}\.\d{4,5}(?:v\d+)?|[a-z-]+(?:\.[A-Z]{2})?/\d{7}(?:v\d+)?)",
+    re.IGNORECASE,
+)
 
 SCHOLAR_USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/118.0 Safari/537.36"
 )
 
+# Opening tag of each Google Scholar result block.
+SCHOLAR_RESULT_MARKER = 'class="gs_r gs_or gs_scl"'
+
 SCHOLAR_PDF_LINK_PATTERN = re.compile(
     r"<div class=\"gs_or_ggsm\".*?<a href=\"([^\"]+)\"",
     re.IGNORECASE | re.DOTALL,
@@ -92,7 +133,42 @@ SCHOLAR_TITLE_HTML_PATTERN = re.compile(
     r"<h3 class=\"gs_rt\"[^>]*>(.*?)</h3>", re.IGNORECASE | re.DOTALL
 )
 
-HTML_TAG_PATTERN = re.compile(r"<[^>]+>")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+# "[PDF]" / "[HTML]" style tags at the start of a Scholar result title.
+LEADING_BRACKETS_PATTERN = re.compile(r"^(?:\[[^\]]+\]\s*)+")
+
+# One ``<target>; param=value; ...`` entry of an HTTP Link header.
+LINK_HEADER_PATTERN = re.compile(r"<([^>]*)>((?:\s*;\s*[^;,]+)*)")
+LINK_PARAM_PATTERN = re.compile(r'(\w+)\s*=\s*"?([^";]*)"?')
+
+DIRECT_FETCH_HEADERS = {
+    "User-Agent": SCHOLAR_USER_AGENT,
+    "Accept": "application/pdf,text/html;q=0.9,*/*;q=0.8",
+}
+DIRECT_FETCH_TIMEOUT = 30.0
+DIRECT_FETCH_WORKERS = 8
+HTTP_CHUNK_SIZE = 256 * 1024
+PDF_MAGIC = b"%PDF"
+
+# Crossref returns publisher full-text links for many DOIs in one request.
+CROSSREF_WORKS_URL = "https://api.crossref.org/works"
+CROSSREF_BATCH_SIZE = 20
+
+LINK_CACHE_PATH = Path.home() / ".cache" / "fetch_pdfs" / "links.json"
+LINK_CACHE_TTL = 90 * 86400
+# "Not a PDF" answers can change with the network the user is on or with a
+# publisher's temporary error page, so they are trusted for much less long.
+LINK_CACHE_NEGATIVE_TTL = 86400
+DRIVER_CACHE_PATH = Path.home() / ".cache" / "fetch_pdfs" / "driver_paths.json"
+
+# Throttling responses that are worth retrying with exponential backoff.
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+HTTP_MAX_ATTEMPTS = 4
+HTTP_BACKOFF_SECONDS = 1.0
+HTTP_MAX_BACKOFF_SECONDS = 30.0
+
+# Lookups that exhausted their retries are not repeated for this many seconds.
+NEGATIVE_LOOKUP_TTL = 300.0
 
 
 PDF_MERGER_AVAILABLE = PdfMerger is not None
@@ -106,19 +182,29 @@ def page_requires_verification(page_source: str, current_url: str = "") -> bool:
     if any(keyword in source_lower for keyword in CHALLENGE_KEYWORDS):
         return True
 
-    url_lower = current_url.lower()
-    if "sorry/index" in url_lower and "scholar.google" in url_lower:
-        return True
+    return _is_challenge_url(current_url)
+
 
-    return False
+def _is_challenge_url(url: str) -> bool:
+    url_lower = url.lower()
+    return "sorry/index" in url_lower and "scholar.google" in url_lower
 
 
+# The reference helpers below are pure and called several times per reference
+# (search query, signature, title, manual fallback), so their results are cached.
+REFERENCE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=REFERENCE_CACHE_SIZE)
 def _strip_reference_lead(text: str) -> str:
     """Remove numbering prefixes such as "[2]", "3.", or "4 Authors"."""
 
-    stripped = REFERENCE_LEAD_PATTERN.sub("", text, count=1).strip()
-    stripped = LOOSE_REFERENCE_LEAD_PATTERN.sub("", stripped, count=1).strip()
-    return stripped
+    # References reach this from several helpers, usually with the number already
+    # removed by extract_references; only run the patterns when one could match.
+    first = text[:1]
+    if not (first in "[(" or first.isdigit() or first.isspace()):
+        return text.strip()
+    return REFERENCE_LEAD_PATTERN.sub("", text, count=1).strip()
 
 
 def extract_references(text: str) -> List[str]:
@@ -133,6 +219,7 @@ def extract_references(text: str) -> List[str]:
 
     references: List[str] = []
     current: List[str] = []
+    starts_reference = REFERENCE_START_PATTERN.match
 
     for line in text.splitlines():
         stripped = line.strip()
@@ -142,12 +229,7 @@ def extract_references(text: str) -> List[str]:
                 current = []
             continue
 
-        lead_match = REFERENCE_LEAD_PATTERN.match(stripped)
-        loose_match = None
-        if not lead_match:
-            loose_match = LOOSE_REFERENCE_LEAD_PATTERN.match(stripped)
-
-        if lead_match or loose_match:
+        if starts_reference(stripped):
             if current:
                 references.append(" ".join(current))
                 current = []
@@ -162,22 +244,33 @@ def extract_references(text: str) -> List[str]:
 
 
 INVALID_FILENAME_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+MULTI_UNDERSCORE_PATTERN = re.compile(r"_+")
 
 
+@lru_cache(maxsize=REFERENCE_CACHE_SIZE)
 def _sanitize_filename(name: str) -> str:
-    normalized = unicodedata.normalize("NFKD", name)
-    without_marks = "".join(
-        ch for ch in normalized if not unicodedata.combining(ch)
-    ).strip()
+    if name.isascii():
+        # Nothing to decompose; skip the per-character Unicode lookups.
+        without_marks = name.strip()
+    else:
+        normalized = unicodedata.normalize("NFKD", name)
+        without_marks = "".join(
+            ch for ch in normalized if not unicodedata.combining(ch)
+        ).strip()
     sanitized = INVALID_FILENAME_CHARS.sub("_", without_marks)
-    sanitized = re.sub(r"_+", "_", sanitized).strip("._")
+    sanitized = MULTI_UNDERSCORE_PATTERN.sub("_", sanitized).strip("._")
     return sanitized
 
 
 YEAR_PATTERN = re.compile(r"\b(19|20)\d{2}\b")
 TITLE_PATTERN = re.compile(r"\.\s+([A-Z][^.]+?)\.\s+[A-Z]")
+# The capitalised word ending the first author segment ("J. Smith, ..." -> "Smith").
+SURNAME_PATTERN = re.compile(r"([A-Z][A-Za-zÀ-ÖØ-öø-ÿ'`-]+)$")
+# A "title" that is really just an author name such as "Smith, J.".
+NAME_ONLY_PATTERN = re.compile(r"^[A-Z][A-Za-zÀ-ÖØ-öø-ÿ'`-]+,?\s*[A-Z]?\.?$")
 
 
+@lru_cache(maxsize=REFERENCE_CACHE_SIZE)
 def derive_title(reference: str) -> str:
     """Attempt to extract the study title from a reference string."""
 
@@ -218,6 +311,7 @@ def derive_title(reference: str) -> str:
     return candidate
 
 
+@lru_cache(maxsize=REFERENCE_CACHE_SIZE)
 def _extract_first_author(reference: str) -> str:
     cleaned = _strip_reference_lead(reference)
     if not cleaned:
@@ -227,12 +321,13 @@ def _extract_first_author(reference: str) -> str:
     if not first_segment:
         return ""
 
-    match = re.search(r"([A-Z][A-Za-zÀ-ÖØ-öø-ÿ'`-]+)$", first_segment)
+    match = SURNAME_PATTERN.search(first_segment)
     if match:
         return match.group(1)
     return ""
 
 
+@lru_cache(maxsize=REFERENCE_CACHE_SIZE)
 def _extract_journal(reference: str) -> str:
     cleaned = _strip_reference_lead(reference)
     if not cleaned:
@@ -248,22 +343,51 @@ def _extract_journal(reference: str) -> str:
     return ""
 
 
+def _find_links(
+    cleaned: str, stop_at_doi: bool = True
+) -> Tuple[Optional[str], Optional[str]]:
+    """Return the first DOI and first URL in ``cleaned`` using one regex pass.
+
+    A DOI embedded in a URL (``https://doi.org/10...``) counts as the DOI. By
+    default the scan stops at the first DOI since most callers prefer it over a
+    plain URL; pass ``stop_at_doi=False`` to also find a URL that follows it.
+    """
+
+    first_doi: Optional[str] = None
+    first_url: Optional[str] = None
+    for match in LINK_PATTERN.finditer(cleaned):
+        doi = match.group("doi")
+        if doi is None:
+            url = match.group("url")
+            embedded = DOI_PATTERN.search(url)
+            if embedded is None:
+                if first_url is None:
+                    first_url = _strip_trailing_punctuation(url)
+                    if first_doi is not None:
+                        break
+                continue
+            doi = _strip_trailing_punctuation(embedded.group(0))
+        if first_doi is None:
+            first_doi = doi
+            if stop_at_doi or first_url is not None:
+                break
+    return first_doi, first_url
+
+
 def build_search_query(reference: str) -> str:
     cleaned = _strip_reference_lead(reference)
     if not cleaned:
         return reference
 
-    doi_match = DOI_PATTERN.search(cleaned)
-    if doi_match:
-        return _strip_trailing_punctuation(doi_match.group(0))
-
-    url_match = URL_PATTERN.search(cleaned)
-    if url_match:
-        return _strip_trailing_punctuation(url_match.group(0))
+    doi, url = _find_links(cleaned)
+    if doi:
+        return doi
+    if url:
+        return url
 
     components: List[str] = []
 
-    normalized_reference = re.sub(r"\s+", " ", cleaned).strip()
+    normalized_reference = WHITESPACE_PATTERN.sub(" ", cleaned).strip()
     if normalized_reference:
         components.append(normalized_reference)
 
@@ -272,7 +396,7 @@ def build_search_query(reference: str) -> str:
         bool(title)
         and len(title) >= 8
         and "," not in title
-        and not re.match(r"^[A-Z][A-Za-zÀ-ÖØ-öø-ÿ'`-]+,?\s*[A-Z]?\.?$", title)
+        and not NAME_ONLY_PATTERN.match(title)
     )
     if title_is_valid:
         components.append(title)
@@ -307,6 +431,15 @@ def _strip_trailing_punctuation(value: str) -> str:
     return value.rstrip(TRAILING_PUNCTUATION)
 
 
+URL_SIGNATURE_PREFIX = re.compile(r"^https?://(?:www\.)?", re.IGNORECASE)
+
+
+def _url_signature(url: str) -> str:
+    """Fold URL variants that citation styles produce (scheme, ``www.``, trailing /)."""
+
+    return URL_SIGNATURE_PREFIX.sub("", url).rstrip("/").lower()
+
+
 def build_reference_signature(reference: str, title: str = "") -> Optional[str]:
     """Generate a normalized token used to detect duplicate references."""
 
@@ -314,19 +447,19 @@ def build_reference_signature(reference: str, title: str = "") -> Optional[str]:
     if not cleaned:
         return None
 
-    doi_match = DOI_PATTERN.search(cleaned)
-    if doi_match:
-        return f"doi:{_strip_trailing_punctuation(doi_match.group(0)).lower()}"
-
-    url_match = URL_PATTERN.search(cleaned)
-    if url_match:
-        return f"url:{_strip_trailing_punctuation(url_match.group(0)).lower()}"
+    doi, url = _find_links(cleaned)
+    if doi:
+        return f"doi:{doi.lower()}"
+    if url:
+        return f"url:{_url_signature(url)}"
 
-    normalized_title = re.sub(r"\s+", " ", title).strip().lower()
+    # casefold() so references differing only in "ß"/"ss"-style case variants
+    # are treated as duplicates.
+    normalized_title = WHITESPACE_PATTERN.sub(" ", title).strip().casefold()
     if normalized_title:
         return f"title:{normalized_title}"
 
-    normalized_reference = re.sub(r"\s+", " ", cleaned).strip().lower()
+    normalized_reference = WHITESPACE_PATTERN.sub(" ", cleaned).strip().casefold()
     return normalized_reference or None
 
 
@@ -337,6 +470,8 @@ class DownloadResult:
     message: str
     destination: Optional[Path] = None
     used_filename: Optional[str] = None
+    # Where the PDF was fetched from, when that URL is reusable.
+    source_url: Optional[str] = None
 
 
 @dataclass
@@ -346,6 +481,7 @@ class ReferenceTask:
     output_name: str
     preview: str
     duplicate_of: Optional[int] = None
+    signature: Optional[str] = None
 
 
 @dataclass
@@ -385,6 +521,63 @@ def _dedupe_path(path: Path) -> Path:
     return final_path
 
 
+_destination_lock = threading.Lock()
+
+
+def _make_work_dir(destination: Path) -> Path:
+    """Create a hidden scratch folder inside ``destination``.
+
+    Keeping downloads on the destination's file system turns the final move into
+    a rename instead of a copy. Falls back to the system temp folder when the
+    destination is not writable.
+    """
+
+    try:
+        return Path(tempfile.mkdtemp(prefix=".fetch_pdfs_", dir=destination))
+    except OSError:
+        return Path(tempfile.mkdtemp(prefix="fetch_pdfs_"))
+
+
+# Scratch folders untouched for this long were left behind by a session that
+# crashed; live sessions refresh theirs on every run.
+STALE_WORK_DIR_SECONDS = 86400
+
+
+def _remove_stale_work_dirs(destination: Path) -> None:
+    cutoff = time.time() - STALE_WORK_DIR_SECONDS
+    try:
+        with os.scandir(destination) as entries:
+            stale = [
+                entry.path
+                for entry in entries
+                if entry.name.startswith(".fetch_pdfs_")
+                and entry.is_dir(follow_symlinks=False)
+                and entry.stat(follow_symlinks=False).st_mtime < cutoff
+            ]
+    except OSError:
+        return
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+
+
+def _move_to_unique_path(source: Path, destination: Path) -> Path:
+    """Move ``source`` to a free variant of ``destination`` and return it.
+
+    Parallel workers can finish PDFs with the same title at the same time, so the
+    name is chosen and claimed under a single lock.
+    """
+
+    with _destination_lock:
+        final_path = _dedupe_path(destination)
+        try:
+            # A plain rename when both live on one file system (the usual case,
+            # see _make_work_dir); shutil.move copies across devices.
+            os.replace(source, final_path)
+        except OSError:
+            shutil.move(str(source), final_path)
+    return final_path
+
+
 def stitch_pdfs(
     pdf_files: List[Path], destination_dir: Path
 ) -> Tuple[Optional[Path], Optional[str]]:
@@ -474,6 +667,68 @@ def export_pdf_texts(
     return text_path, None
 
 
+PDF_SUFFIX = ".pdf"
+
+
+def _is_pdf_filename(name: str) -> bool:
+    """Return True for finished PDF files (partial ``.part`` downloads excluded)."""
+
+    return name.lower().endswith(PDF_SUFFIX)
+
+
+# Sidecar suffixes browsers use while a download is still being written.
+PARTIAL_DOWNLOAD_SUFFIXES = (".part", ".crdownload", ".tmp", ".download")
+
+
+def _download_in_progress(path: str) -> bool:
+    return any(os.path.exists(path + suffix) for suffix in PARTIAL_DOWNLOAD_SUFFIXES)
+
+
+class _FolderChangeHandler(FileSystemEventHandler):
+    def __init__(self, changed: threading.Event) -> None:
+        super().__init__()
+        self._changed = changed
+
+    def on_any_event(self, event) -> None:
+        self._changed.set()
+
+
+# A manually downloaded PDF must keep the same size this long to count as done.
+MANUAL_STABLE_SECONDS = 0.5
+
+
+@contextmanager
+def _folder_changes(directory: Path) -> Iterator[Optional[threading.Event]]:
+    """Yield an Event that is set whenever ``directory`` changes.
+
+    Uses ``watchdog`` (inotify, FSEvents or ReadDirectoryChangesW) when installed.
+    Yields ``None`` without it so callers keep polling on a fixed interval.
+    """
+
+    if Observer is None:
+        yield None
+        return
+
+    changed = threading.Event()
+    observer = Observer()
+    try:
+        observer.schedule(_FolderChangeHandler(changed), str(directory), recursive=False)
+        observer.start()
+    except Exception:
+        yield None
+        return
+    try:
+        yield changed
+    finally:
+        observer.stop()
+        observer.join(timeout=1)
+
+
+def _pdf_names(directory: Path) -> set[str]:
+    with os.scandir(directory) as entries:
+        return {entry.name for entry in entries if _is_pdf_filename(entry.name)}
+
+
 def get_default_download_dir() -> Path:
     """Best-effort guess of the user's default download directory."""
 
@@ -487,46 +742,75 @@ def get_default_download_dir() -> Path:
 
 def wait_for_manual_pdf(
     download_dir: Path,
-    existing_files: set[Path],
+    existing_names: set[str],
     timeout: float,
     skip_event: Optional[threading.Event] = None,
 ) -> Optional[Path]:
-    """Poll the user's download directory for a new PDF file."""
+    """Wait for a new PDF file in the user's download directory.
 
-    deadline = time.time() + max(timeout, 1.0)
-    resolved_existing = {p.resolve() for p in existing_files}
-    size_tracker: dict[Path, int] = {}
-    stable_counts: dict[Path, int] = {}
+    ``existing_names`` are the file names present before the download started. A
+    PDF counts once its size has held for ``MANUAL_STABLE_SECONDS`` and the browser
+    has no partial-download sidecar for it. With ``watchdog`` installed the folder
+    is rescanned when it changes rather than once a second.
+    """
 
-    while time.time() < deadline:
-        if skip_event is not None and skip_event.is_set():
-            raise SkipRequested()
+    deadline = time.time() + max(timeout, 1.0)
+    # name -> (size, time that size was first seen)
+    size_tracker: dict[str, Tuple[int, float]] = {}
 
-        for candidate in download_dir.glob("*.pdf"):
-            try:
-                resolved = candidate.resolve()
-            except FileNotFoundError:
-                continue
-            if resolved in resolved_existing:
-                continue
-            try:
-                size = resolved.stat().st_size
-            except OSError:
-                continue
-            previous_size = size_tracker.get(resolved)
-            if previous_size is not None and size == previous_size:
-                stable_counts[resolved] = stable_counts.get(resolved, 0) + 1
+    with _folder_changes(download_dir) as changed:
+        while time.time() < deadline:
+            if skip_event is not None and skip_event.is_set():
+                raise SkipRequested()
+            if changed is not None:
+                changed.clear()
+
+            now = time.time()
+            with os.scandir(download_dir) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name in existing_names or not _is_pdf_filename(name):
+                        continue
+                    if _download_in_progress(entry.path):
+                        continue
+                    try:
+                        size = entry.stat().st_size
+                    except OSError:
+                        continue
+                    previous = size_tracker.get(name)
+                    if previous is None or previous[0] != size:
+                        size_tracker[name] = (size, now)
+                    elif now - previous[1] >= MANUAL_STABLE_SECONDS:
+                        return Path(entry.path)
+
+            if changed is None:
+                if skip_event is not None:
+                    skip_event.wait(1)
+                else:
+                    time.sleep(1)
             else:
-                stable_counts[resolved] = 0
-            size_tracker[resolved] = size
-            if stable_counts[resolved] >= 1:
-                return resolved
-
-        time.sleep(1)
+                # Wake on folder events, but still rescan to confirm a size held.
+                changed.wait(MANUAL_STABLE_SECONDS)
 
     return None
 
 
+# Failures a second browser pass cannot change: the same Scholar query returns
+# the same (or no) first result. Timeouts and verification problems are not here.
+TERMINAL_FAILURE_MESSAGES = frozenset(
+    {
+        "No Google Scholar results were found",
+        "First result is missing an article link to follow",
+        "First result did not provide a downloadable PDF",
+        "Downloaded PDF was empty",
+    }
+)
+
+
+def _is_retry_worthy(result: DownloadResult) -> bool:
+    return not result.success and result.message not in TERMINAL_FAILURE_MESSAGES
+
+
 def _merge_failure_messages(initial: str, retry: str) -> str:
     parts: List[str] = []
     if initial:
@@ -549,6 +833,43 @@ def _make_absolute_url(url: str, base: str) -> str:
     return url
 
 
+class _HTMLTextExtractor(HTMLParser):
+    """Collect the text of an HTML fragment, reading every tag as a space."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.parts: List[str] = []
+
+    def handle_data(self, data: str) -> None:
+        self.parts.append(data)
+
+    def handle_starttag(self, tag: str, attrs) -> None:
+        self.parts.append(" ")
+
+    def handle_endtag(self, tag: str) -> None:
+        self.parts.append(" ")
+
+
+def _html_to_text(fragment: str) -> str:
+    """Return the text of ``fragment`` with tags removed and entities decoded.
+
+    Entities are decoded after tags are recognised, so an escaped ``&lt;`` in a
+    title stays text instead of being mistaken for the start of a tag.
+    """
+
+    parser = _HTMLTextExtractor()
+    parser.feed(fragment)
+    parser.close()
+    return "".join(parser.parts)
+
+
+def _clean_result_title(text: str) -> str:
+    """Collapse whitespace and drop leading "[PDF]"-style tags from a title."""
+
+    text = WHITESPACE_PATTERN.sub(" ", text).strip()
+    return LEADING_BRACKETS_PATTERN.sub("", text).strip()
+
+
 def _parse_manual_targets(
     html: str, base: str
 ) -> Tuple[Optional[str], Optional[str], Optional[str]]:
@@ -556,6 +877,14 @@ def _parse_manual_targets(
     article_url: Optional[str] = None
     title: Optional[str] = None
 
+    # Only look inside the first result, so a PDF link from a later result is
+    # never paired with the first title; a page without the marker is searched
+    # whole.
+    start = html.find(SCHOLAR_RESULT_MARKER)
+    if start != -1:
+        end = html.find(SCHOLAR_RESULT_MARKER, start + len(SCHOLAR_RESULT_MARKER))
+        html = html[start:end] if end != -1 else html[start:]
+
     pdf_match = SCHOLAR_PDF_LINK_PATTERN.search(html)
     if pdf_match:
         pdf_url = _make_absolute_url(unescape(pdf_match.group(1).strip()), base)
@@ -566,32 +895,153 @@ def _parse_manual_targets(
 
     title_match = SCHOLAR_TITLE_HTML_PATTERN.search(html)
     if title_match:
-        fragment = unescape(title_match.group(1))
-        fragment = HTML_TAG_PATTERN.sub(" ", fragment)
-        fragment = re.sub(r"\s+", " ", fragment).strip()
-        while True:
-            cleaned = re.sub(r"^\[[^\]]+\]\s*", "", fragment).strip()
-            if cleaned == fragment:
-                break
-            fragment = cleaned
-        title = fragment or None
+        title = _clean_result_title(_html_to_text(title_match.group(1))) or None
 
     return pdf_url, article_url, title
 
 
-def resolve_manual_targets(reference: str, timeout: float = 10.0) -> ManualTargets:
+def _retry_delay(attempt: int, retry_after: Optional[str]) -> float:
+    """Seconds to wait before retrying, honouring a numeric ``Retry-After``."""
+
+    if retry_after:
+        try:
+            return min(max(float(retry_after), 0.0), HTTP_MAX_BACKOFF_SECONDS)
+        except ValueError:
+            pass
+    delay = HTTP_BACKOFF_SECONDS * (2 ** attempt)
+    return min(delay * random.uniform(0.5, 1.5), HTTP_MAX_BACKOFF_SECONDS)
+
+
+def _read_url(
+    request: Request, timeout: float, skip_event: Optional[threading.Event] = None
+) -> bytes:
+    """Fetch ``request``, backing off and retrying on throttling responses.
+
+    Setting ``skip_event`` cuts a backoff short with ``SkipRequested``.
+    """
+
+    attempt = 0
+    while True:
+        try:
+            with urlopen(request, timeout=timeout) as response:
+                return response.read()
+        except HTTPError as exc:
+            if exc.code not in RETRY_STATUS_CODES or attempt + 1 >= HTTP_MAX_ATTEMPTS:
+                raise
+            delay = _retry_delay(attempt, exc.headers.get("Retry-After"))
+        if skip_event is not None:
+            if skip_event.wait(delay):
+                raise SkipRequested()
+        else:
+            time.sleep(delay)
+        attempt += 1
+
+
+_scholar_connections = threading.local()
+# Parallel Scholar lookups for the manual fallback; kept low to avoid throttling.
+MANUAL_LOOKUP_WORKERS = 4
+
+
+def _read_scholar_page(url: str, timeout: float) -> bytes:
+    """Fetch a Scholar page over a kept-alive connection owned by this thread.
+
+    Consecutive manual-fallback lookups then skip the TCP and TLS handshakes, and
+    pages are requested gzip-compressed. Redirects are handed to ``_read_url``;
+    throttling answers are retried there only after the usual backoff, and any
+    other error status raises ``HTTPError``.
+    """
+
+    parts = urlsplit(url)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    headers = {"User-Agent": SCHOLAR_USER_AGENT}
+    connection_class = (
+        http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+    )
+    key = (parts.scheme, parts.hostname, parts.port)
+
+    for _ in range(2):
+        connection = getattr(_scholar_connections, "connection", None)
+        reused = connection is not None and _scholar_connections.key == key
+        if not reused:
+            if connection is not None:
+                connection.close()
+            connection = connection_class(parts.hostname, parts.port, timeout=timeout)
+            _scholar_connections.connection = connection
+            _scholar_connections.key = key
+        try:
+            if connection.sock is not None:
+                connection.sock.settimeout(timeout)
+            connection.request(
+                "GET", path, headers={**headers, "Accept-Encoding": "gzip"}
+            )
+            response = connection.getresponse()
+            body = response.read()
+        except (http.client.HTTPException, OSError):
+            connection.close()
+            _scholar_connections.connection = None
+            if reused:
+                # The server may have dropped the idle connection; retry fresh.
+                continue
+            raise
+        if response.will_close:
+            connection.close()
+            _scholar_connections.connection = None
+        if response.status == 200:
+            if response.getheader("Content-Encoding", "").lower() == "gzip":
+                body = gzip.decompress(body)
+            return body
+        break
+
+    if response.status in RETRY_STATUS_CODES:
+        # Back off before asking again; _read_url continues the backoff from here.
+        time.sleep(_retry_delay(0, response.getheader("Retry-After")))
+    elif not 300 <= response.status < 400:
+        raise HTTPError(url, response.status, response.reason, response.msg, None)
+    return _read_url(Request(url, headers=headers), timeout)
+
+
+_failed_lookups: dict[str, float] = {}
+_failed_lookups_lock = threading.Lock()
+
+
+def _lookup_recently_failed(key: str) -> bool:
+    with _failed_lookups_lock:
+        expires = _failed_lookups.get(key)
+        if expires is None:
+            return False
+        if expires <= time.monotonic():
+            del _failed_lookups[key]
+            return False
+        return True
+
+
+def _remember_failed_lookup(key: str) -> None:
+    with _failed_lookups_lock:
+        _failed_lookups[key] = time.monotonic() + NEGATIVE_LOOKUP_TTL
+
+
+@lru_cache(maxsize=REFERENCE_CACHE_SIZE)
+def build_scholar_query_url(reference: str) -> str:
+    """Return the Google Scholar results URL for ``reference``."""
+
     query = build_search_query(reference)
     if not query.strip():
         query = reference
-    query_url = (
-        f"{SCHOLAR_BASE_URL}/scholar?hl=en&as_sdt=0%2C5&q={quote_plus(query)}"
-    )
+    return SCHOLAR_QUERY_URL_PREFIX + quote_plus(query)
+
+
+def resolve_manual_targets(reference: str, timeout: float = 10.0) -> ManualTargets:
+    query_url = build_scholar_query_url(reference)
+
+    if _lookup_recently_failed(query_url):
+        return ManualTargets(query_url, None, None)
 
     try:
-        request = Request(query_url, headers={"User-Agent": SCHOLAR_USER_AGENT})
-        with urlopen(request, timeout=timeout) as response:
-            html_bytes = response.read()
+        html_bytes = _read_scholar_page(query_url, timeout)
     except Exception:
+        _remember_failed_lookup(query_url)
         return ManualTargets(query_url, None, None)
 
     html_text = html_bytes.decode("utf-8", errors="ignore")
@@ -602,6 +1052,442 @@ def resolve_manual_targets(reference: str, timeout: float = 10.0) -> ManualTarge
     return ManualTargets(query_url, article_url, pdf_url, title)
 
 
+def _arxiv_doi_pdf_url(doi: str) -> Optional[str]:
+    # DataCite arXiv DOIs look like 10.48550/arXiv.1706.03762.
+    suffix = doi.split("/", 1)[1]
+    if suffix.lower().startswith("arxiv."):
+        return ARXIV_PDF_URL + suffix[len("arxiv."):]
+    return None
+
+
+# DOI registrant prefix -> builder of the publisher's PDF URL, for publishers
+# whose PDF location follows from the DOI alone (no landing page needed).
+PUBLISHER_FAST_PATHS: dict[str, Callable[[str], Optional[str]]] = {
+    "10.48550": _arxiv_doi_pdf_url,
+}
+
+
+def find_direct_links(reference: str) -> List[str]:
+    """Return the direct-download candidates in ``reference`` in the order to try.
+
+    A URL that already ends in ``.pdf`` comes first since it needs no DOI redirect
+    chain, then an arXiv identifier's PDF and any ``PUBLISHER_FAST_PATHS`` URL
+    for the DOI. The DOI resolver follows, so a non-PDF landing page URL still
+    has the DOI as a fallback.
+    """
+
+    cleaned = _strip_reference_lead(reference)
+    if not cleaned:
+        return []
+
+    doi, url = _find_links(cleaned, stop_at_doi=False)
+    candidates: List[str] = []
+    url_is_pdf = bool(url) and _is_pdf_filename(url.split("?", 1)[0].split("#", 1)[0])
+    if url and url_is_pdf:
+        candidates.append(url)
+    arxiv_match = ARXIV_ID_PATTERN.search(cleaned)
+    if arxiv_match:
+        candidates.append(ARXIV_PDF_URL + arxiv_match.group(1))
+    if doi:
+        fast_path = PUBLISHER_FAST_PATHS.get(doi.split("/", 1)[0])
+        publisher_url = fast_path(doi) if fast_path else None
+        if publisher_url and publisher_url not in candidates:
+            candidates.append(publisher_url)
+        candidates.append(DOI_RESOLVER_URL + doi)
+    if url and not url_is_pdf:
+        candidates.append(url)
+    return candidates
+
+
+def find_reference_doi(reference: str) -> Optional[str]:
+    """Return the first DOI in ``reference``, if any."""
+
+    cleaned = _strip_reference_lead(reference)
+    if not cleaned:
+        return None
+    return _find_links(cleaned)[0]
+
+
+def lookup_crossref_pdf_links(
+    dois: Iterable[str],
+    timeout: float = DIRECT_FETCH_TIMEOUT,
+    skip_event: Optional[threading.Event] = None,
+) -> dict[str, str]:
+    """Map DOIs (lowercased) to the ``application/pdf`` links Crossref lists for them.
+
+    DOIs are queried ``CROSSREF_BATCH_SIZE`` at a time. Failed batches are skipped
+    so their DOIs simply fall back to the regular lookup. Once ``skip_event`` is
+    set the links found so far are returned.
+    """
+
+    # Commas separate filter values, so such DOIs cannot be batched.
+    unique = [doi for doi in dict.fromkeys(d.lower() for d in dois) if "," not in doi]
+    pdf_links: dict[str, str] = {}
+    for start in range(0, len(unique), CROSSREF_BATCH_SIZE):
+        if skip_event is not None and skip_event.is_set():
+            break
+        batch = unique[start : start + CROSSREF_BATCH_SIZE]
+        query = urlencode(
+            {
+                "filter": ",".join(f"doi:{doi}" for doi in batch),
+                "select": "DOI,link",
+                "rows": len(batch),
+            }
+        )
+        request = Request(
+            f"{CROSSREF_WORKS_URL}?{query}",
+            headers={"User-Agent": SCHOLAR_USER_AGENT, "Accept": "application/json"},
+        )
+        try:
+            payload = json.loads(_read_url(request, timeout, skip_event))
+        except SkipRequested:
+            break
+        except (OSError, ValueError):
+            continue
+        items = payload.get("message", {}).get("items") if isinstance(payload, dict) else None
+        for item in items or []:
+            doi = str(item.get("DOI", "")).lower()
+            for link in item.get("link") or []:
+                if link.get("content-type") == "application/pdf" and link.get("URL"):
+                    pdf_links.setdefault(doi, link["URL"])
+                    break
+    return pdf_links
+
+
+class LinkCache:
+    """Persistent record of where direct links resolved and whether they were PDFs.
+
+    Lets a later run jump straight to the publisher's PDF URL, or skip the HTTP
+    attempt entirely for links known to land on an HTML page. PDF entries older
+    than ``ttl`` seconds are ignored, non-PDF ones after ``negative_ttl``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        ttl: float = LINK_CACHE_TTL,
+        negative_ttl: float = LINK_CACHE_NEGATIVE_TTL,
+    ) -> None:
+        self.path = path
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self._entries: dict[str, dict] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path = LINK_CACHE_PATH) -> "LinkCache":
+        cache = cls(path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cache
+        if isinstance(data, dict) and isinstance(data.get("links"), dict):
+            cache._entries = data["links"]
+        return cache
+
+    def get(self, url: str) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(url)
+        if not isinstance(entry, dict) or self._expired(entry, time.time()):
+            return None
+        return entry
+
+    def _expired(self, entry: dict, now: float) -> bool:
+        ttl = self.ttl if entry.get("pdf") else self.negative_ttl
+        return now - entry.get("ts", 0) > ttl
+
+    def put(self, url: str, final_url: str, is_pdf: bool) -> None:
+        with self._lock:
+            self._entries[url] = {"final": final_url, "pdf": is_pdf, "ts": time.time()}
+            self._dirty = True
+
+    # References are stored under "ref:<signature>" next to the plain URL entries,
+    # pointing at the PDF URL a browser worker found for them.
+    def reference_pdf_url(self, signature: Optional[str]) -> Optional[str]:
+        entry = self.get(f"ref:{signature}") if signature else None
+        if entry is None or not entry.get("pdf"):
+            return None
+        return entry.get("final")
+
+    def remember_reference(self, signature: Optional[str], pdf_url: Optional[str]) -> None:
+        if signature and pdf_url:
+            self.put(f"ref:{signature}", pdf_url, True)
+
+    def forget(self, url: str) -> None:
+        with self._lock:
+            if self._entries.pop(url, None) is not None:
+                self._dirty = True
+
+    def forget_reference(self, signature: Optional[str]) -> None:
+        if signature:
+            self.forget(f"ref:{signature}")
+
+    def save(self) -> None:
+        with self._lock:
+            if not self._dirty:
+                return
+            now = time.time()
+            entries = {
+                url: entry
+                for url, entry in self._entries.items()
+                if isinstance(entry, dict) and not self._expired(entry, now)
+            }
+            self._dirty = False
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps({"links": entries}), encoding="utf-8")
+            os.replace(temp_path, self.path)
+        except OSError:
+            pass
+
+
+def _is_pdf_response(response) -> bool:
+    content_type = response.headers.get("Content-Type", "")
+    return "pdf" in content_type.lower() or _is_pdf_filename(response.geturl())
+
+
+def _signposted_pdf_url(response) -> Optional[str]:
+    """Return the PDF a landing page advertises via ``Link: <...>; rel="item"``.
+
+    Publishers implementing FAIR Signposting list the full text this way, which
+    saves scraping the HTML for a PDF link.
+    """
+
+    for header in response.headers.get_all("Link") or []:
+        for target, params in LINK_HEADER_PATTERN.findall(header):
+            values = {key.lower(): value for key, value in LINK_PARAM_PATTERN.findall(params)}
+            if "item" not in values.get("rel", "").split():
+                continue
+            if "pdf" not in values.get("type", "").lower():
+                continue
+            return urljoin(response.geturl(), target.strip())
+    return None
+
+
+def fetch_direct_pdf(
+    url: str,
+    download_dir: Path,
+    timeout: float = DIRECT_FETCH_TIMEOUT,
+    skip_event: Optional[threading.Event] = None,
+    link_cache: Optional[LinkCache] = None,
+    headers: Optional[dict[str, str]] = None,
+    opener: Optional[OpenerDirector] = None,
+    follow_signposts: bool = True,
+) -> Optional[Path]:
+    """Download ``url`` into ``download_dir`` without a browser when it serves a PDF.
+
+    A single GET follows redirects (e.g. DOI to publisher) and its headers are
+    checked before any of the body is read, so HTML landing pages are rejected
+    after one round trip. Returns the saved file, or ``None`` when the link does
+    not lead to a readable PDF. When ``link_cache`` knows the link, the redirect
+    chain (or the whole request, for known HTML pages) is skipped; a remembered
+    PDF URL that stopped working is dropped and the link itself is tried again. A landing page
+    that signposts its PDF in a ``Link`` header is followed one hop. ``headers``
+    and ``opener`` let callers replay a browser session (user agent, cookies).
+    """
+
+    cached = link_cache.get(url) if link_cache is not None else None
+    if cached is not None:
+        if not cached.get("pdf"):
+            return None
+        final = cached.get("final")
+        if final and final != url:
+            downloaded = fetch_direct_pdf(
+                final,
+                download_dir,
+                timeout,
+                skip_event,
+                headers=headers,
+                opener=opener,
+                follow_signposts=False,
+            )
+            if downloaded is not None:
+                return downloaded
+            # Signed publisher URLs expire; go through the original link again.
+            link_cache.forget(url)
+
+    request = Request(url, headers={**DIRECT_FETCH_HEADERS, **(headers or {})})
+    try:
+        if opener is not None:
+            response = opener.open(request, timeout=timeout)
+        else:
+            response = urlopen(request, timeout=timeout)
+    except Exception:
+        # Includes 401/402/403 paywalls: not cached, since access depends on the
+        # network the user is on.
+        return None
+
+    final_url = response.geturl()
+    if not _is_pdf_response(response):
+        item_url = _signposted_pdf_url(response) if follow_signposts else None
+        response.close()
+        if item_url is None:
+            if link_cache is not None:
+                link_cache.put(url, final_url, False)
+            return None
+        downloaded = fetch_direct_pdf(
+            item_url,
+            download_dir,
+            timeout,
+            skip_event,
+            headers=headers,
+            opener=opener,
+            follow_signposts=False,
+        )
+        if link_cache is not None:
+            link_cache.put(url, item_url, downloaded is not None)
+        return downloaded
+
+    with response:
+        fd, temp_name = tempfile.mkstemp(
+            prefix="direct_", suffix=".part", dir=download_dir
+        )
+        temp_path = Path(temp_name)
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                first_chunk = response.read(HTTP_CHUNK_SIZE)
+                if not first_chunk.startswith(PDF_MAGIC):
+                    if link_cache is not None:
+                        link_cache.put(url, final_url, False)
+                    raise ValueError("not a PDF")
+                chunk = first_chunk
+                while chunk:
+                    handle.write(chunk)
+                    if skip_event is not None and skip_event.is_set():
+                        raise SkipRequested()
+                    chunk = response.read(HTTP_CHUNK_SIZE)
+        except SkipRequested:
+            temp_path.unlink(missing_ok=True)
+            raise
+        except Exception:
+            temp_path.unlink(missing_ok=True)
+            return None
+
+    if link_cache is not None:
+        link_cache.put(url, final_url, True)
+    return temp_path
+
+
+def _cookie_jar_from_browser(cookies: Iterable[dict]) -> CookieJar:
+    """Convert Selenium ``get_cookies()`` output into a urllib cookie jar."""
+
+    jar = CookieJar()
+    for cookie in cookies:
+        domain = cookie.get("domain") or ""
+        jar.set_cookie(
+            Cookie(
+                version=0,
+                name=cookie.get("name", ""),
+                value=cookie.get("value", ""),
+                port=None,
+                port_specified=False,
+                domain=domain,
+                domain_specified=domain.startswith("."),
+                domain_initial_dot=domain.startswith("."),
+                path=cookie.get("path") or "/",
+                path_specified=True,
+                secure=bool(cookie.get("secure")),
+                expires=cookie.get("expiry"),
+                discard=False,
+                comment=None,
+                comment_url=None,
+                rest={},
+            )
+        )
+    return jar
+
+
+def download_direct(
+    reference: str,
+    output_name: str,
+    final_dir: Path,
+    work_dir: Path,
+    skip_event: Optional[threading.Event] = None,
+    link_cache: Optional[LinkCache] = None,
+    preferred_links: Iterable[str] = (),
+) -> Optional[DownloadResult]:
+    """Fetch DOI/URL references over plain HTTP, bypassing Google Scholar.
+
+    ``preferred_links`` (e.g. a PDF link from Crossref or an earlier run) are
+    tried before the links in the reference. Returns ``None`` when no candidate
+    serves a PDF, leaving the reference to the browser workers.
+    """
+
+    links = list(dict.fromkeys([*preferred_links, *find_direct_links(reference)]))
+
+    downloaded: Optional[Path] = None
+    for link in links:
+        downloaded = fetch_direct_pdf(
+            link, work_dir, skip_event=skip_event, link_cache=link_cache
+        )
+        if downloaded is not None:
+            break
+    if downloaded is None:
+        return None
+
+    destination = _move_to_unique_path(downloaded, final_dir / f"{output_name}.pdf")
+    return DownloadResult(
+        reference,
+        True,
+        "Downloaded directly",
+        destination,
+        used_filename=destination.stem,
+        source_url=link,
+    )
+
+
+# Resolved WebDriver binaries keyed by browser. Selenium Manager is not safe to run
+# from several threads at once, so the first lookup happens under the lock.
+_DRIVER_PATHS: dict[str, str] = {}
+_DRIVER_LOCK = threading.Lock()
+
+
+def _load_driver_paths() -> None:
+    """Seed ``_DRIVER_PATHS`` from disk, keeping only binaries that still exist."""
+
+    try:
+        data = json.loads(DRIVER_CACHE_PATH.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    if not isinstance(data, dict):
+        return
+    for browser, path in data.items():
+        if isinstance(path, str) and os.path.isfile(path):
+            _DRIVER_PATHS.setdefault(browser, path)
+
+
+def _save_driver_paths() -> None:
+    try:
+        DRIVER_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_CACHE_PATH.write_text(json.dumps(_DRIVER_PATHS), encoding="utf-8")
+    except OSError:
+        pass
+
+
+def _launch_firefox(options: "FirefoxOptions") -> "webdriver.Remote":
+    with _DRIVER_LOCK:
+        if not _DRIVER_PATHS:
+            _load_driver_paths()
+        driver_path = _DRIVER_PATHS.get("firefox")
+        if driver_path is not None and not os.path.isfile(driver_path):
+            driver_path = None
+        driver_path = driver_path or shutil.which("geckodriver")
+        if driver_path is None:
+            # Selenium Manager locates (or downloads) geckodriver; remember where.
+            driver = webdriver.Firefox(options=options)
+            resolved = getattr(driver.service, "path", None)
+            if resolved:
+                _DRIVER_PATHS["firefox"] = resolved
+                _save_driver_paths()
+            return driver
+        _DRIVER_PATHS["firefox"] = driver_path
+
+    service = FirefoxService(executable_path=driver_path)
+    return webdriver.Firefox(options=options, service=service)
+
+
 class SkipRequested(Exception):
     """Raised when the user requests to skip the current download."""
 
@@ -609,14 +1495,138 @@ class SkipRequested(Exception):
 class PDFDownloader:
     """Handles Selenium browser automation to download PDF files via Google Scholar."""
 
-    SCHOLAR_URL = "https://scholar.google.com/"
     CHALLENGE_TIMEOUT = 180
+    # Folder polling starts fast for small PDFs and backs off for slow ones.
+    DOWNLOAD_POLL_MIN_INTERVAL = 0.05
+    DOWNLOAD_POLL_MAX_INTERVAL = 0.5
+
+    # Same test as page_requires_verification, run in the page: a captcha element
+    # or any CHALLENGE_KEYWORDS in the markup, plus the current URL.
+    CHALLENGE_PROBE_SCRIPT = f"""
+        if (document.querySelector(
+                "form#captcha-form, #gs_captcha_ccl, iframe[src*='recaptcha']")) {{
+            return [true, location.href];
+        }}
+        const root = document.documentElement;
+        const html = root ? root.outerHTML.toLowerCase() : "";
+        const keywords = {json.dumps(list(CHALLENGE_KEYWORDS))};
+        return [keywords.some((keyword) => html.includes(keyword)), location.href];
+    """
+
+    # Google Scholar page structure.
+    RESULT_SELECTOR = "div.gs_r.gs_or.gs_scl"
+    RESULT_TITLE_SELECTOR = "h3"
+    RESULT_ARTICLE_LINK_SELECTOR = "h3 a"
+    RESULT_PDF_LINK_SELECTOR = "div.gs_or_ggsm a"
+    # Scholar's notice for a query with no matches (queries are sent with hl=en).
+    NO_RESULTS_SCRIPT = (
+        "return !!document.body"
+        ' && document.body.innerText.includes("did not match any articles");'
+    )
+    # Reads the title, PDF link and article link of a result in one WebDriver
+    # call instead of one find_element round trip each. An article link that
+    # points straight at a .pdf doubles as the PDF link, so it is fetched over
+    # HTTP instead of being opened in a tab.
+    RESULT_PARTS_SCRIPT = f"""
+        const block = arguments[0];
+        const title = block.querySelector("{RESULT_TITLE_SELECTOR}");
+        const article = block.querySelector("{RESULT_ARTICLE_LINK_SELECTOR}");
+        let pdf = block.querySelector("{RESULT_PDF_LINK_SELECTOR}");
+        if (!pdf && article) {{
+            const path = (article.getAttribute("href") || "").split(/[?#]/)[0];
+            if (path.toLowerCase().endsWith(".pdf")) {{
+                pdf = article;
+            }}
+        }}
+        return [
+            title ? (title.innerText || title.textContent || "") : "",
+            pdf,
+            article,
+        ];
+    """
+    # Upper bound between scans when folder events wake the wait instead.
+    DOWNLOAD_EVENT_INTERVAL = 0.5
+    # A download that keeps growing may run past the timeout, up to this limit.
+    DOWNLOAD_MAX_SECONDS = 600.0
+
+    # Finds the best visible PDF link in one WebDriver call: one whose path ends in
+    # .pdf (looked for first among the few anchors that mention .pdf), otherwise
+    # the first anchor whose href, text or title mentions PDF.
+    PDF_LINK_SCRIPT = """
+        const visible = (link) => {
+            const box = link.getBoundingClientRect();
+            return box.width !== 0 && box.height !== 0
+                && getComputedStyle(link).visibility !== "hidden";
+        };
+        for (const link of document.querySelectorAll('a[href*=".pdf" i]')) {
+            const href = link.getAttribute("href").toLowerCase();
+            if (href.split(/[?#]/)[0].endsWith(".pdf") && visible(link)) {
+                return link;
+            }
+        }
+        for (const link of document.querySelectorAll("a[href]")) {
+            const href = (link.getAttribute("href") || "").toLowerCase();
+            const text = (link.textContent || "").toLowerCase();
+            const title = (link.title || "").toLowerCase();
+            const label = (link.getAttribute("aria-label") || "").toLowerCase();
+            if ((href.includes(".pdf") || text.includes("pdf") || title.includes("pdf")
+                    || label.includes("pdf")) && visible(link)) {
+                return link;
+            }
+        }
+        return null;
+    """
+    # Same scan, also reporting whether the page had finished loading first.
+    PDF_LINK_READY_SCRIPT = (
+        'const ready = document.readyState === "complete";'
+        f"const link = (() => {{{PDF_LINK_SCRIPT}}})();"
+        "return [link, ready];"
+    )
+    # How long to keep looking once the page has loaded without a PDF link, for
+    # links that scripts insert after the load event.
+    PDF_LINK_GRACE_SECONDS = 3.0
+    # Upper bound for the in-page fetch. It blocks the worker and cannot see Skip,
+    # and the click-and-wait fallback still gets the full download timeout.
+    IN_PAGE_FETCH_SECONDS = 10.0
+
+    # Fetches a link from inside the page (same origin, with the page's cookies
+    # and credentials) and hands the body back base64-encoded. Only PDF responses
+    # are read; anything else (an HTML viewer page, say) is dropped after the
+    # headers, and the request is aborted in the page after ``timeoutMs``.
+    IN_PAGE_FETCH_SCRIPT = """
+        const [link, timeoutMs, done] = arguments;
+        const controller = new AbortController();
+        setTimeout(() => controller.abort(), timeoutMs);
+        fetch(link.href, {credentials: "include", signal: controller.signal})
+            .then(response => {
+                const type = (response.headers.get("content-type") || "").toLowerCase();
+                if (response.ok && type.includes("pdf")) {
+                    return response.blob();
+                }
+                controller.abort();
+                return null;
+            })
+            .then(blob => {
+                if (!blob) {
+                    done(null);
+                    return;
+                }
+                const reader = new FileReader();
+                reader.onload = () => done(String(reader.result).split(",", 2)[1] || null);
+                reader.onerror = () => done(null);
+                reader.readAsDataURL(blob);
+            })
+            .catch(() => done(null));
+    """
 
     def __init__(
         self,
         download_dir: Path,
-        challenge_callback: Optional[Callable[[str], None]] = None,
+        challenge_callback: Optional[
+            Callable[[str, Optional[threading.Event]], None]
+        ] = None,
         download_timeout: float = 30.0,
+        headless: bool = False,
     ) -> None:
         if webdriver is None:
             raise RuntimeError(
@@ -625,13 +1635,18 @@ class PDFDownloader:
             )
         self.download_dir = download_dir
         self.browser_label = "Firefox"
-        self.driver = self._create_driver(download_dir)
+        self.headless = headless
+        self.driver = self._create_driver(download_dir, headless)
         self.base_handle = self.driver.current_window_handle
+        self._user_agent: Optional[str] = None
         self.challenge_callback = challenge_callback
         self.download_timeout = max(1.0, float(download_timeout))
+        # PDFs already present in the download folder. Kept across downloads so
+        # each one does not have to snapshot the directory again.
+        self._known_files: set[str] = _pdf_names(download_dir)
 
     @staticmethod
-    def _create_driver(download_dir: Path) -> "webdriver.Remote":
+    def _create_driver(download_dir: Path, headless: bool = False) -> "webdriver.Remote":
         options = FirefoxOptions()
         options.set_preference("browser.download.folderList", 2)
         options.set_preference("browser.download.dir", str(download_dir))
@@ -641,10 +1656,31 @@ class PDFDownloader:
         options.set_preference("pdfjs.disabled", True)
         options.set_preference("browser.download.manager.showWhenStarting", False)
         options.set_preference("browser.download.useDownloadDir", True)
-
-        driver = webdriver.Firefox(options=options)
-
-        driver.maximize_window()
+        # Publisher pages load nothing we need from notification, push or
+        # autoplaying media; block them so pages settle sooner.
+        options.set_preference("dom.webnotifications.enabled", False)
+        options.set_preference("dom.push.enabled", False)
+        options.set_preference("media.autoplay.default", 5)
+        # Each driver gets a throwaway profile, so a disk cache is never reused.
+        options.set_preference("browser.cache.disk.enable", False)
+        # Return from driver.get() at DOMContentLoaded; every lookup afterwards
+        # waits for the elements it needs instead of for ads and fonts.
+        options.page_load_strategy = "eager"
+        if headless:
+            # Nobody sees the pages, so skip rendering and decoding images.
+            options.add_argument("-headless")
+            options.set_preference("permissions.default.image", 2)
+            # Drop analytics and ad requests from Firefox's tracker list too.
+            options.set_preference("privacy.trackingprotection.enabled", True)
+
+        driver = _launch_firefox(options)
+
+        if headless:
+            # No screen to maximise to; use a desktop-sized viewport so pages
+            # serve their full layout (and PDF links) rather than a mobile one.
+            driver.set_window_size(1920, 1080)
+        else:
+            driver.maximize_window()
         return driver
 
     def close(self) -> None:
@@ -653,6 +1689,37 @@ class PDFDownloader:
         except Exception:
             pass
 
+    def clear_download_dir(self) -> None:
+        """Remove leftovers from earlier runs so every new file is one of ours."""
+
+        with os.scandir(self.download_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        shutil.rmtree(entry.path, ignore_errors=True)
+                    else:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
+        self._known_files = _pdf_names(self.download_dir)
+
+    def restart(self) -> None:
+        """Replace a dead or wedged browser session with a fresh one."""
+
+        self.close()
+        self.driver = self._create_driver(self.download_dir, self.headless)
+        self.base_handle = self.driver.current_window_handle
+        self._user_agent = None
+
+    def is_alive(self) -> bool:
+        """Return whether the browser session still responds (e.g. not closed by hand)."""
+
+        try:
+            self.driver.switch_to.window(self.base_handle)
+        except WebDriverException:
+            return False
+        return True
+
     def download(
         self,
         reference: str,
@@ -660,7 +1727,28 @@ class PDFDownloader:
         final_dir: Path,
         skip_event: Optional[threading.Event] = None,
     ) -> DownloadResult:
-        existing_files = {p for p in self.download_dir.iterdir() if p.is_file()}
+        try:
+            return self._download(reference, output_name, final_dir, skip_event)
+        except WebDriverException as exc:
+            # Typically the window was closed or the browser crashed mid-attempt;
+            # the pool restarts dead browsers after a failed attempt.
+            return DownloadResult(reference, False, f"Browser session failed: {exc}")
+        finally:
+            # Forget files that have since been moved or removed so a later PDF
+            # with the same name is still recognised as new.
+            self._known_files = {
+                name
+                for name in self._known_files
+                if (self.download_dir / name).exists()
+            }
+
+    def _download(
+        self,
+        reference: str,
+        output_name: str,
+        final_dir: Path,
+        skip_event: Optional[threading.Event],
+    ) -> DownloadResult:
         try:
             self._search_reference(reference, skip_event)
         except SkipRequested:
@@ -672,23 +1760,33 @@ class PDFDownloader:
             result_block = self._get_first_result(skip_event)
         except SkipRequested:
             return DownloadResult(reference, False, "Skipped by user")
-        except TimeoutException:
-            return DownloadResult(reference, False, "No Google Scholar results were found")
-
-        result_title = self._extract_result_title_text(result_block)
+        except TimeoutException as exc:
+            # Only a genuine empty results page is final; a slow page or an
+            # unsolved verification may well work on the retry.
+            if self._results_page_is_empty():
+                return DownloadResult(
+                    reference, False, "No Google Scholar results were found"
+                )
+            return DownloadResult(
+                reference,
+                False,
+                f"Google Scholar results did not load ({exc.msg or 'timed out'})",
+            )
 
         try:
-            pdf_link = self._extract_pdf_link(result_block)
+            result_title, pdf_link, article_link = self._read_result_parts(
+                result_block
+            )
         except WebDriverException as exc:
             return DownloadResult(reference, False, f"Unable to inspect the first result: {exc}")
 
         article_handle: Optional[str] = None
         article_opened_in_new_tab = False
+        downloaded: Optional[Path] = None
+        pdf_href: Optional[str] = None
 
         if pdf_link is None:
-            try:
-                article_link = result_block.find_element(By.CSS_SELECTOR, "h3 a")
-            except NoSuchElementException:
+            if article_link is None:
                 return DownloadResult(
                     reference, False, "First result is missing an article link to follow"
                 )
@@ -705,30 +1803,64 @@ class PDFDownloader:
             except SkipRequested:
                 return DownloadResult(reference, False, "Skipped by user")
             except TimeoutException:
-                return DownloadResult(
-                    reference,
-                    False,
-                    "Could not locate a PDF link on the article page",
-                )
+                # An article link that serves the PDF itself never shows a page:
+                # Firefox saves the response straight into the download folder.
+                downloaded, in_progress = self._scan_for_new_file()
+                if downloaded is None and in_progress:
+                    try:
+                        downloaded = self._wait_for_new_file(skip_event)
+                    except SkipRequested:
+                        return DownloadResult(reference, False, "Skipped by user")
+                if downloaded is None:
+                    return DownloadResult(
+                        reference,
+                        False,
+                        "Could not locate a PDF link on the article page",
+                    )
 
-        if pdf_link is None:
+        if pdf_link is None and downloaded is None:
             return DownloadResult(
                 reference,
                 False,
                 "First result did not provide a downloadable PDF",
             )
 
-        try:
-            self.driver.execute_script("arguments[0].click();", pdf_link)
-        except WebDriverException as exc:
-            return DownloadResult(reference, False, f"Failed to trigger PDF download: {exc}")
+        if downloaded is None:
+            try:
+                pdf_href, page_url = self.driver.execute_script(
+                    "return [arguments[0].href, location.href];", pdf_link
+                )
+            except (WebDriverException, TypeError, ValueError):
+                pdf_href, page_url = None, None
+            if not (pdf_href and pdf_href.lower().startswith(("http://", "https://"))):
+                pdf_href = None
+
+            try:
+                if pdf_href is not None:
+                    downloaded = self._fetch_with_browser_session(
+                        pdf_href, page_url, skip_event
+                    )
+                if downloaded is None:
+                    downloaded = self._fetch_in_page(pdf_link, skip_event)
+            except SkipRequested:
+                return DownloadResult(reference, False, "Skipped by user")
 
-        try:
-            downloaded = self._wait_for_new_file(existing_files, skip_event)
-        except SkipRequested:
-            return DownloadResult(reference, False, "Skipped by user")
         if downloaded is None:
-            return DownloadResult(reference, False, "Download did not complete in time")
+            try:
+                self.driver.execute_script("arguments[0].click();", pdf_link)
+            except WebDriverException as exc:
+                return DownloadResult(
+                    reference, False, f"Failed to trigger PDF download: {exc}"
+                )
+
+            try:
+                downloaded = self._wait_for_new_file(skip_event)
+            except SkipRequested:
+                return DownloadResult(reference, False, "Skipped by user")
+            if downloaded is None:
+                return DownloadResult(
+                    reference, False, "Download did not complete in time"
+                )
 
         try:
             downloaded_size = downloaded.stat().st_size
@@ -762,45 +1894,99 @@ class PDFDownloader:
         sanitized_title = _sanitize_filename(result_title)[:150] if result_title else ""
         final_name = sanitized_title if sanitized_title else output_name
 
-        destination = final_dir / f"{final_name}.pdf"
-        destination = self._dedupe_destination(destination)
-        shutil.move(str(downloaded), destination)
-        return DownloadResult(
-            reference,
-            True,
-            "Downloaded",
-            destination,
-            used_filename=destination.stem,
+        destination = _move_to_unique_path(downloaded, final_dir / f"{final_name}.pdf")
+        return DownloadResult(
+            reference,
+            True,
+            "Downloaded",
+            destination,
+            used_filename=destination.stem,
+            source_url=pdf_href,
+        )
+
+    def _fetch_with_browser_session(
+        self,
+        href: str,
+        referer: Optional[str],
+        skip_event: Optional[threading.Event] = None,
+    ) -> Optional[Path]:
+        """Stream the PDF at ``href`` over HTTP, replaying the browser's cookies.
+
+        Skips Firefox's download manager and the folder polling entirely. Returns
+        ``None`` when the target is not served as a PDF so the caller can fall back
+        to clicking the link.
+        """
+
+        try:
+            cookies = self.driver.get_cookies()
+            if self._user_agent is None:
+                self._user_agent = self.driver.execute_script(
+                    "return navigator.userAgent;"
+                )
+        except WebDriverException:
+            return None
+
+        opener = build_opener(HTTPCookieProcessor(_cookie_jar_from_browser(cookies)))
+        headers = {"User-Agent": self._user_agent or SCHOLAR_USER_AGENT}
+        if referer:
+            headers["Referer"] = referer
+        return fetch_direct_pdf(
+            href,
+            self.download_dir,
+            skip_event=skip_event,
+            headers=headers,
+            opener=opener,
+        )
+
+    def _fetch_in_page(
+        self, link, skip_event: Optional[threading.Event] = None
+    ) -> Optional[Path]:
+        """Fetch ``link`` with the page's own ``fetch()`` and save it if it is a PDF.
+
+        Covers sites that only serve the PDF to requests carrying the page's full
+        browser context, without navigating the tab or waiting on the download
+        folder. Cross-origin links usually fail here (CORS) and return ``None``.
+        """
+
+        fetch_seconds = min(self.download_timeout, self.IN_PAGE_FETCH_SECONDS)
+        try:
+            # A little slack so the page's own abort answers before WebDriver gives up.
+            self.driver.set_script_timeout(fetch_seconds + 1)
+            encoded = self.driver.execute_async_script(
+                self.IN_PAGE_FETCH_SCRIPT, link, int(fetch_seconds * 1000)
+            )
+        except WebDriverException:
+            return None
+        self._check_skip(skip_event)
+        if not encoded:
+            return None
+        try:
+            content = base64.b64decode(encoded)
+        except ValueError:
+            return None
+        if not content.startswith(PDF_MAGIC):
+            return None
+
+        fd, temp_name = tempfile.mkstemp(
+            prefix="page_", suffix=".part", dir=self.download_dir
         )
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(content)
+        return Path(temp_name)
 
     def _search_reference(
         self, reference: str, skip_event: Optional[threading.Event] = None
     ) -> None:
-        query = build_search_query(reference)
-        if not query.strip():
-            query = reference
-
         try:
             self.driver.switch_to.window(self.base_handle)
         except WebDriverException:
             pass
-        self.driver.get(self.SCHOLAR_URL)
-        self._handle_challenge(
-            "Google Scholar asked for verification before the search box became available.",
-            skip_event,
-        )
-
-        def locate_box(driver):
-            self._check_skip(skip_event)
-            return driver.find_element(By.NAME, "q")
-
-        wait = WebDriverWait(self.driver, 20)
-        search_box = wait.until(locate_box)
-        search_box.clear()
-        search_box.send_keys(query)
-        search_box.submit()
+        # Load the results page directly rather than the home page plus a typed
+        # query; _get_first_result waits for the results to render.
+        self._check_skip(skip_event)
+        self.driver.get(build_scholar_query_url(reference))
         self._handle_challenge(
-            "Google Scholar requested verification after submitting the query.",
+            "Google Scholar requested verification before showing the search results.",
             skip_event,
         )
 
@@ -813,7 +1999,7 @@ class PDFDownloader:
                 "Google Scholar needs verification before showing the search results.",
                 skip_event,
             )
-            wait = WebDriverWait(self.driver, 10)
+            wait = WebDriverWait(self.driver, 10, poll_frequency=0.1)
             try:
                 return wait.until(
                     lambda drv: self._locate_first_result(drv, skip_event)
@@ -822,53 +2008,47 @@ class PDFDownloader:
                 last_exception = exc
         if last_exception:
             raise last_exception
-        raise TimeoutException("No Google Scholar results were found")
+        raise TimeoutException("Google Scholar results did not load in time")
+
+    def _results_page_is_empty(self) -> bool:
+        try:
+            return bool(self.driver.execute_script(self.NO_RESULTS_SCRIPT))
+        except WebDriverException:
+            return False
 
     def _locate_first_result(
         self, driver, skip_event: Optional[threading.Event]
     ):
         self._check_skip(skip_event)
-        elements = driver.find_elements(By.CSS_SELECTOR, "div.gs_r.gs_or.gs_scl")
+        elements = driver.find_elements(By.CSS_SELECTOR, self.RESULT_SELECTOR)
         return elements[0] if elements else False
 
-    @staticmethod
-    def _extract_pdf_link(result_block):
-        try:
-            return result_block.find_element(By.CSS_SELECTOR, "div.gs_or_ggsm a")
-        except NoSuchElementException:
-            return None
+    def _read_result_parts(self, result_block):
+        """Return ``(title, pdf_link, article_link)`` for a Scholar result."""
 
-    @staticmethod
-    def _extract_result_title_text(result_block) -> str:
         try:
-            title_element = result_block.find_element(By.CSS_SELECTOR, "h3")
-        except NoSuchElementException:
-            return ""
-
-        raw_text = (title_element.text or "").strip()
-        if not raw_text:
-            raw_text = (title_element.get_attribute("textContent") or "").strip()
-
-        normalized = re.sub(r"\s+", " ", raw_text).strip()
-        while True:
-            cleaned = re.sub(r"^\[[^\]]+\]\s*", "", normalized).strip()
-            if cleaned == normalized:
-                break
-            normalized = cleaned
+            raw_title, pdf_link, article_link = self.driver.execute_script(
+                self.RESULT_PARTS_SCRIPT, result_block
+            )
+        except (TypeError, ValueError):
+            raw_title, pdf_link, article_link = "", None, None
 
-        return normalized
+        return _clean_result_title(raw_title or ""), pdf_link, article_link
 
     def _open_article_link(
         self, link, skip_event: Optional[threading.Event] = None
     ):
         existing_handles = set(self.driver.window_handles)
+        previous_url = self.driver.current_url
         try:
             self.driver.execute_script("arguments[0].click();", link)
         except WebDriverException:
             link.click()
 
-        new_handle = self._wait_for_new_window(existing_handles, skip_event)
-        if new_handle:
+        new_handle = self._wait_for_new_window(
+            existing_handles, skip_event, previous_url
+        )
+        if new_handle and new_handle not in existing_handles:
             self.driver.switch_to.window(new_handle)
             return new_handle, True
         return self.driver.current_window_handle, False
@@ -876,50 +2056,108 @@ class PDFDownloader:
     def _wait_for_pdf_link(
         self, skip_event: Optional[threading.Event] = None
     ):
-        wait = WebDriverWait(self.driver, 20, poll_frequency=0.5)
+        wait = WebDriverWait(self.driver, 20, poll_frequency=0.1)
+        loaded_at: List[float] = []
 
         def locate(driver):
             self._check_skip(skip_event)
-            candidates = driver.find_elements(
-                By.XPATH,
-                "//a[contains(@href, '.pdf') or contains(translate(text(), 'pdf', 'PDF'), 'PDF')]",
-            )
-            for candidate in candidates:
-                try:
-                    if candidate.is_enabled() and candidate.is_displayed():
-                        return candidate
-                except WebDriverException:
-                    continue
+            try:
+                link, ready = driver.execute_script(self.PDF_LINK_READY_SCRIPT)
+            except (WebDriverException, TypeError, ValueError):
+                return False
+            if link:
+                return link
+            if ready:
+                # Fail fast on fully loaded pages that simply have no PDF link.
+                if not loaded_at:
+                    loaded_at.append(time.time())
+                elif time.time() - loaded_at[0] > self.PDF_LINK_GRACE_SECONDS:
+                    raise TimeoutException("Article page loaded without a PDF link")
             return False
 
         return wait.until(locate)
 
     def _wait_for_new_file(
-        self, existing_files: set[Path], skip_event: Optional[threading.Event] = None
+        self, skip_event: Optional[threading.Event] = None
     ) -> Optional[Path]:
-        timeout = time.time() + self.download_timeout
-        while time.time() < timeout:
-            self._check_skip(skip_event)
-            current_files = {p for p in self.download_dir.iterdir() if p.is_file()}
-            new_files = current_files - existing_files
-            for candidate in new_files:
-                if candidate.suffix.lower() == ".pdf" and not candidate.name.endswith(".part"):
-                    return candidate
-            time.sleep(1)
+        """Wait for a finished PDF in the download folder.
+
+        The timeout counts from the last sign of progress, so a large PDF that is
+        still streaming into its ``.part`` file is not abandoned half-way.
+        """
+
+        started = time.time()
+        timeout = started + self.download_timeout
+        hard_limit = started + max(self.download_timeout, self.DOWNLOAD_MAX_SECONDS)
+        partial_bytes = 0
+        poll_interval = self.DOWNLOAD_POLL_MIN_INTERVAL
+        with _folder_changes(self.download_dir) as changed:
+            while time.time() < timeout:
+                self._check_skip(skip_event)
+                if changed is not None:
+                    changed.clear()
+                found, in_progress = self._scan_for_new_file()
+                if found is not None:
+                    return found
+                if in_progress > partial_bytes:
+                    partial_bytes = in_progress
+                    timeout = min(time.time() + self.download_timeout, hard_limit)
+                if changed is None:
+                    if skip_event is not None:
+                        skip_event.wait(poll_interval)
+                    else:
+                        time.sleep(poll_interval)
+                    poll_interval = min(
+                        poll_interval * 1.5, self.DOWNLOAD_POLL_MAX_INTERVAL
+                    )
+                else:
+                    changed.wait(self.DOWNLOAD_EVENT_INTERVAL)
         return None
 
+    def _scan_for_new_file(self) -> Tuple[Optional[Path], int]:
+        """Return a newly finished PDF (if any) and the bytes of partial downloads."""
+
+        in_progress = 0
+        with os.scandir(self.download_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(PARTIAL_DOWNLOAD_SUFFIXES):
+                    try:
+                        in_progress += entry.stat().st_size
+                    except OSError:
+                        pass
+                    continue
+                if entry.name in self._known_files:
+                    continue
+                if not _is_pdf_filename(entry.name) or not entry.is_file():
+                    continue
+                if _download_in_progress(entry.path):
+                    continue
+                self._known_files.add(entry.name)
+                return Path(entry.path), in_progress
+        return None, in_progress
+
     def _wait_for_new_window(
-        self, existing_handles: set[str], skip_event: Optional[threading.Event] = None
+        self,
+        existing_handles: set[str],
+        skip_event: Optional[threading.Event] = None,
+        previous_url: Optional[str] = None,
     ) -> Optional[str]:
-        end = time.time() + 10
-        while time.time() < end:
+        def new_handle(driver):
             self._check_skip(skip_event)
-            handles = set(self.driver.window_handles)
-            new_handles = handles - existing_handles
+            new_handles = set(driver.window_handles) - existing_handles
             if new_handles:
                 return new_handles.pop()
-            time.sleep(0.5)
-        return None
+            # Links without target="_blank" navigate the current tab instead;
+            # stop waiting as soon as that happens rather than at the timeout.
+            if previous_url is not None and driver.current_url != previous_url:
+                return driver.current_window_handle
+            return False
+
+        wait = WebDriverWait(self.driver, 10, poll_frequency=0.1)
+        try:
+            return wait.until(new_handle)
+        except TimeoutException:
+            return None
 
     def _close_tab(self, handle: str) -> None:
         try:
@@ -943,10 +2181,6 @@ class PDFDownloader:
         except WebDriverException:
             pass
 
-    @staticmethod
-    def _dedupe_destination(path: Path) -> Path:
-        return _dedupe_path(path)
-
     def _handle_challenge(
         self, context: str, skip_event: Optional[threading.Event] = None
     ) -> None:
@@ -963,16 +2197,22 @@ class PDFDownloader:
         )
         if self.challenge_callback is not None:
             try:
-                self.challenge_callback(message)
+                self.challenge_callback(message, skip_event)
             except Exception:
                 pass
 
+        # The callback blocks until the user confirms the dialog, which normally
+        # means the challenge is solved: check straight away, and only fall back
+        # to polling the page if it is still showing.
         deadline = time.time() + self.CHALLENGE_TIMEOUT
         while time.time() < deadline:
             self._check_skip(skip_event)
-            time.sleep(1)
             if not self._is_challenge_page():
                 return
+            if skip_event is not None:
+                skip_event.wait(1)
+            else:
+                time.sleep(1)
 
         raise TimeoutException("Verification challenge was not cleared in time")
 
@@ -982,30 +2222,56 @@ class PDFDownloader:
             raise SkipRequested()
 
     def _is_challenge_page(self) -> bool:
+        # Checked inside the browser so the page source never crosses the wire.
         try:
-            source = self.driver.page_source
-            current_url = self.driver.current_url
-        except WebDriverException:
+            keyword_found, current_url = self.driver.execute_script(
+                self.CHALLENGE_PROBE_SCRIPT
+            )
+        except (WebDriverException, TypeError, ValueError):
             return False
 
-        return page_requires_verification(source, current_url)
+        return bool(keyword_found) or _is_challenge_url(current_url or "")
 
 
 class App(tk.Tk):
+    STATUS_FLUSH_MS = 100
+
     def __init__(self) -> None:
         super().__init__()
         self.title("Fetch Bibliography PDFs")
         self.geometry("700x500")
         self.minsize(500, 400)
         self.resizable(True, True)
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
         self.download_thread: Optional[threading.Thread] = None
-        self.downloader: Optional[PDFDownloader] = None
-        self._skip_event = threading.Event()
+        # Browsers stay open between runs so later batches skip the cold start;
+        # they are closed when the window is.
+        self.downloaders: List[PDFDownloader] = []
+        self._browser_dir: Optional[Path] = None
+        # The destination _browser_dir was made in; browsers move when it changes.
+        self._browser_destination: Optional[Path] = None
+        self._prewarm_thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._active_skip_events: set[threading.Event] = set()
+        self._skip_lock = threading.Lock()
+        # Set by Cancel (or closing the window): every remaining attempt is skipped.
+        self._cancel_event = threading.Event()
+        self._challenge_prompt_lock = threading.Lock()
+        # Cleared while a verification dialog is on screen.
+        self._challenge_dialog_closed = threading.Event()
+        self._challenge_dialog_closed.set()
+        # Worker threads post status text here; the Tk loop shows only the latest.
+        self._pending_status: Optional[str] = None
+        self._status_lock = threading.Lock()
         self.manual_retry_var = tk.BooleanVar(value=True)
         self.manual_auto_var = tk.BooleanVar(value=True)
-        self._manual_prompt_acknowledged = False
+        # Off by default: Scholar verification challenges need a visible window.
+        self.headless_var = tk.BooleanVar(value=False)
+        self.use_cache_var = tk.BooleanVar(value=True)
         self._current_browser_label = "Firefox"
+        self.link_cache = LinkCache.load()
         self._build_ui()
+        self._prewarm_browsers()
 
     def _build_ui(self) -> None:
         self.columnconfigure(0, weight=1)
@@ -1038,24 +2304,45 @@ class App(tk.Tk):
         self.timeout_entry = tk.Entry(path_frame, textvariable=self.timeout_var, width=10)
         self.timeout_entry.grid(row=1, column=1, sticky="w", padx=5, pady=(0, 5))
 
+        tk.Label(path_frame, text="Parallel browsers:").grid(row=2, column=0, sticky="w")
+        self.workers_var = tk.StringVar(value="3")
+        self.workers_spinbox = tk.Spinbox(
+            path_frame, from_=1, to=8, textvariable=self.workers_var, width=5
+        )
+        self.workers_spinbox.grid(row=2, column=1, sticky="w", padx=5, pady=(0, 5))
+
         tk.Label(
             path_frame,
             text="Automated browser: Firefox (requires geckodriver)",
-        ).grid(row=2, column=0, columnspan=3, sticky="w", pady=(0, 5))
+        ).grid(row=3, column=0, columnspan=3, sticky="w", pady=(0, 5))
 
         manual_check = tk.Checkbutton(
             path_frame,
             text="Offer manual browser fallback for missed PDFs",
             variable=self.manual_retry_var,
         )
-        manual_check.grid(row=3, column=0, columnspan=3, sticky="w", pady=(0, 5))
+        manual_check.grid(row=4, column=0, columnspan=3, sticky="w", pady=(0, 5))
 
         auto_manual_check = tk.Checkbutton(
             path_frame,
             text="Try to auto-open the first PDF when manual fallback runs",
             variable=self.manual_auto_var,
         )
-        auto_manual_check.grid(row=4, column=0, columnspan=3, sticky="w", pady=(0, 5))
+        auto_manual_check.grid(row=5, column=0, columnspan=3, sticky="w", pady=(0, 5))
+
+        headless_check = tk.Checkbutton(
+            path_frame,
+            text="Run browsers hidden (faster; turn off if Scholar asks for verification)",
+            variable=self.headless_var,
+        )
+        headless_check.grid(row=6, column=0, columnspan=3, sticky="w", pady=(0, 5))
+
+        cache_check = tk.Checkbutton(
+            path_frame,
+            text="Reuse PDF links remembered from earlier runs",
+            variable=self.use_cache_var,
+        )
+        cache_check.grid(row=7, column=0, columnspan=3, sticky="w", pady=(0, 5))
 
         controls_frame = tk.Frame(self)
         controls_frame.grid(row=3, column=0, sticky="ew", padx=10, pady=(5, 10))
@@ -1078,6 +2365,21 @@ class App(tk.Tk):
         )
         self.skip_button.grid(row=0, column=2, padx=(10, 0))
 
+        self.cancel_button = tk.Button(
+            controls_frame,
+            text="Cancel",
+            command=self._request_cancel,
+            state=tk.DISABLED,
+        )
+        self.cancel_button.grid(row=0, column=3, padx=(10, 0))
+
+        self.restart_button = tk.Button(
+            controls_frame,
+            text="Restart browsers",
+            command=self._restart_browsers,
+        )
+        self.restart_button.grid(row=0, column=4, padx=(10, 0))
+
     def _choose_folder(self) -> None:
         selected = filedialog.askdirectory(initialdir=self.path_var.get())
         if selected:
@@ -1119,15 +2421,35 @@ class App(tk.Tk):
             )
             return
 
+        try:
+            worker_count = int(self.workers_var.get())
+        except ValueError:
+            worker_count = 0
+        if worker_count < 1:
+            messagebox.showerror(
+                "Invalid browser count",
+                "Please enter a whole number of parallel browsers (1 or more).",
+            )
+            return
+
         self._current_browser_label = "Firefox"
 
-        self.status_var.set("Starting downloads...")
+        self._set_status_now("Starting downloads...")
         self.download_button.config(state=tk.DISABLED)
+        self.restart_button.config(state=tk.DISABLED)
         self.skip_button.config(state=tk.NORMAL)
-        self._skip_event.clear()
+        self.cancel_button.config(state=tk.NORMAL)
+        self._cancel_event.clear()
         self.download_thread = threading.Thread(
             target=self._run_downloads,
-            args=(references, destination, timeout_seconds),
+            args=(
+                references,
+                destination,
+                timeout_seconds,
+                worker_count,
+                self.headless_var.get(),
+                self.use_cache_var.get(),
+            ),
             daemon=True,
         )
         self.download_thread.start()
@@ -1137,9 +2459,12 @@ class App(tk.Tk):
         references: List[str],
         destination: Path,
         timeout_seconds: float,
+        worker_count: int,
+        headless: bool = False,
+        use_cache: bool = True,
     ) -> None:
-        self._manual_prompt_acknowledged = False
-        temp_dir = Path(tempfile.mkdtemp(prefix="fetch_pdfs_"))
+        link_cache = self.link_cache if use_cache else None
+        temp_dir = _make_work_dir(destination)
         tasks: List[ReferenceTask] = []
         seen_signatures: dict[str, int] = {}
         for index, reference in enumerate(references, start=1):
@@ -1155,7 +2480,9 @@ class App(tk.Tk):
                 else:
                     seen_signatures[signature] = index
             tasks.append(
-                ReferenceTask(index, reference, output_name, preview, duplicate_of)
+                ReferenceTask(
+                    index, reference, output_name, preview, duplicate_of, signature
+                )
             )
 
         final_results: List[Optional[DownloadResult]] = [None] * len(tasks)
@@ -1164,93 +2491,84 @@ class App(tk.Tk):
         manual_successes: List[ReferenceTask] = []
 
         try:
-            self.downloader = PDFDownloader(
-                temp_dir,
-                self._prompt_challenge,
-                download_timeout=timeout_seconds,
+            self._prefetch_direct_links(
+                tasks, final_results, destination, temp_dir / "direct", link_cache
             )
-            total_tasks = len(references)
+            cancelled = self._cancel_event.is_set()
             for task in tasks:
-                if task.duplicate_of is not None:
-                    self._update_status(
-                        f"Skipping duplicate {task.index}/{total_tasks}: matches entry {task.duplicate_of}"
-                    )
-                    original_result = (
-                        final_results[task.duplicate_of - 1]
-                        if 0 <= task.duplicate_of - 1 < len(final_results)
-                        else None
+                result = final_results[task.index - 1]
+                if result is not None and not cancelled and _is_retry_worthy(result):
+                    retry_candidates.append((task.index - 1, task, result))
+            browser_tasks = [
+                task
+                for task in tasks
+                if task.duplicate_of is None and final_results[task.index - 1] is None
+            ]
+            if cancelled:
+                # Nothing else will run; don't launch (or wait for) browsers.
+                for task in browser_tasks:
+                    final_results[task.index - 1] = DownloadResult(
+                        task.reference, False, "Skipped by user"
                     )
-                    if isinstance(original_result, DownloadResult):
-                        if original_result.success:
-                            message = (
-                                f"Duplicate of entry {task.duplicate_of}; reused downloaded file"
-                            )
-                        else:
-                            reason = (
-                                f"{original_result.message}"
-                                if original_result.message
-                                else "original attempt failed"
-                            )
-                            message = (
-                                f"Duplicate of entry {task.duplicate_of}; original failed: {reason}"
-                            )
-                        final_results[task.index - 1] = DownloadResult(
-                            task.reference,
-                            original_result.success,
-                            message,
-                            original_result.destination,
-                            used_filename=original_result.used_filename,
-                        )
-                    else:
-                        final_results[task.index - 1] = DownloadResult(
-                            task.reference,
-                            False,
-                            f"Duplicate of entry {task.duplicate_of}; original result unavailable",
-                        )
-                    continue
-
-                self._update_status(
-                    f"Processing {task.index}/{total_tasks}: {task.preview}"
+                browser_tasks = []
+            if browser_tasks or retry_candidates:
+                worker_count = max(
+                    1, min(worker_count, len(browser_tasks) or len(retry_candidates))
                 )
-                result = self.downloader.download(
-                    task.reference,
-                    task.output_name,
-                    destination,
-                    skip_event=self._skip_event,
+                active_downloaders = self._acquire_downloaders(
+                    worker_count, timeout_seconds, headless, destination
                 )
-                self._skip_event.clear()
-                final_results[task.index - 1] = result
-                if not result.success:
-                    retry_candidates.append((task.index - 1, task, result))
+            else:
+                active_downloaders = []
+            pool: "queue.Queue[PDFDownloader]" = queue.Queue()
+            for downloader in active_downloaders:
+                pool.put(downloader)
+            total_tasks = len(references)
 
-            if retry_candidates:
+            def attempt(task: ReferenceTask, verb: str) -> DownloadResult:
                 self._update_status(
-                    f"Retrying {len(retry_candidates)} reference(s) that failed initially..."
+                    f"{verb} {task.index}/{total_tasks}: {task.preview}"
                 )
-                for slot, task, first_result in retry_candidates:
-                    if task.duplicate_of is not None:
-                        continue
+                result = self._download_with_pool(pool, task, destination)
+                if link_cache is not None and result.success:
+                    link_cache.remember_reference(task.signature, result.source_url)
+                return result
+
+            with ThreadPoolExecutor(max_workers=max(1, len(active_downloaders))) as executor:
+                futures = {
+                    executor.submit(attempt, task, "Processing"): task
+                    for task in browser_tasks
+                }
+                for future in as_completed(futures):
+                    task = futures[future]
+                    result = future.result()
+                    final_results[task.index - 1] = result
+                    if _is_retry_worthy(result):
+                        retry_candidates.append((task.index - 1, task, result))
+                retry_candidates.sort(key=lambda candidate: candidate[0])
+
+                if retry_candidates and not self._cancel_event.is_set():
                     self._update_status(
-                        f"Retrying {task.index}/{len(references)}: {task.preview}"
+                        f"Retrying {len(retry_candidates)} reference(s) that failed initially..."
                     )
-                    retry_result = self.downloader.download(
-                        task.reference,
-                        task.output_name,
-                        destination,
-                        skip_event=self._skip_event,
-                    )
-                    self._skip_event.clear()
-                    if retry_result.success:
-                        retry_result.message = "Downloaded on retry"
-                        final_results[slot] = retry_result
-                        retry_successes.append(task)
-                    else:
-                        retry_result.message = _merge_failure_messages(
-                            first_result.message, retry_result.message
-                        )
-                        final_results[slot] = retry_result
+                    retry_futures = {
+                        executor.submit(attempt, task, "Retrying"): (slot, task, first)
+                        for slot, task, first in retry_candidates
+                    }
+                    for future in as_completed(retry_futures):
+                        slot, task, first_result = retry_futures[future]
+                        retry_result = future.result()
+                        if retry_result.success:
+                            retry_result.message = "Downloaded on retry"
+                            final_results[slot] = retry_result
+                            retry_successes.append(task)
+                        else:
+                            retry_result.message = _merge_failure_messages(
+                                first_result.message, retry_result.message
+                            )
+                            final_results[slot] = retry_result
 
-            if self.manual_retry_var.get():
+            if self.manual_retry_var.get() and not self._cancel_event.is_set():
                 manual_timeout = 60.0
                 manual_successes = self._run_manual_fallback(
                     tasks,
@@ -1258,6 +2576,8 @@ class App(tk.Tk):
                     destination,
                     manual_timeout,
                 )
+
+            self._resolve_duplicates(tasks, final_results)
         except Exception as exc:  # pragma: no cover - GUI feedback only
             error_message = str(exc)
             for idx, value in enumerate(final_results):
@@ -1269,14 +2589,20 @@ class App(tk.Tk):
                 final_results = [DownloadResult("Initialization", False, error_message)]
             retry_successes = []
         finally:
-            if self.downloader:
-                self.downloader.close()
-            shutil.rmtree(temp_dir, ignore_errors=True)
-
-        results: List[DownloadResult]
-        if final_results and all(isinstance(r, DownloadResult) for r in final_results):
-            results = [r for r in final_results if isinstance(r, DownloadResult)]
-        else:
+            # Leftovers (failed or partial downloads) can take a while to delete;
+            # don't hold back the summary for them.
+            threading.Thread(
+                target=shutil.rmtree,
+                args=(temp_dir,),
+                kwargs={"ignore_errors": True},
+                daemon=True,
+            ).start()
+            self.link_cache.save()
+
+        # Every slot is filled by now (None only marks "not attempted yet" while the
+        # run is in progress), so one pass both checks and narrows the type.
+        results: List[DownloadResult] = [r for r in final_results if r is not None]
+        if not results or len(results) != len(final_results):
             results = [DownloadResult("Initialization", False, "Downloader did not start")]  # pragma: no cover
 
         success = sum(1 for r in results if r.success)
@@ -1337,6 +2663,322 @@ class App(tk.Tk):
 
         self._finish(summary_lines)
 
+    def _prefetch_direct_links(
+        self,
+        tasks: List[ReferenceTask],
+        final_results: List[Optional[DownloadResult]],
+        destination: Path,
+        work_dir: Path,
+        link_cache: Optional[LinkCache] = None,
+    ) -> None:
+        """Fetch every DOI/URL reference over HTTP concurrently before browsers start.
+
+        References whose PDF URL an earlier run remembered are included even
+        without a DOI or link. Successful and skipped entries are written into
+        ``final_results``; anything else is left empty for the browser workers.
+        """
+
+        remembered: dict[int, str] = {}
+        if link_cache is not None:
+            for task in tasks:
+                url = link_cache.reference_pdf_url(task.signature)
+                if url and task.duplicate_of is None:
+                    remembered[task.index] = url
+        candidates = [
+            task
+            for task in tasks
+            if task.duplicate_of is None
+            and (task.index in remembered or find_direct_links(task.reference))
+        ]
+        if not candidates:
+            return
+
+        work_dir.mkdir(parents=True, exist_ok=True)
+        dois = {task.index: find_reference_doi(task.reference) for task in candidates}
+        crossref_links: dict[str, str] = {}
+        if any(dois.values()):
+            self._update_status("Looking up PDF links on Crossref...")
+            crossref_links = lookup_crossref_pdf_links(
+                (doi for doi in dois.values() if doi), skip_event=self._cancel_event
+            )
+        self._update_status(f"Checking {len(candidates)} direct link(s)...")
+
+        def fetch(task: ReferenceTask) -> Optional[DownloadResult]:
+            with self._skip_scope() as skip_event:
+                try:
+                    return download_direct(
+                        task.reference,
+                        task.output_name,
+                        destination,
+                        work_dir,
+                        skip_event=skip_event,
+                        link_cache=link_cache,
+                        preferred_links=[
+                            link
+                            for link in (
+                                remembered.get(task.index),
+                                crossref_links.get((dois[task.index] or "").lower()),
+                            )
+                            if link
+                        ],
+                    )
+                except SkipRequested:
+                    return DownloadResult(task.reference, False, "Skipped by user")
+
+        max_workers = min(DIRECT_FETCH_WORKERS, len(candidates))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for task, result in zip(candidates, executor.map(fetch, candidates)):
+                if result is not None:
+                    final_results[task.index - 1] = result
+                elif task.index in remembered and link_cache is not None:
+                    # The remembered URL stopped working; let the browser find a
+                    # new one.
+                    link_cache.forget_reference(task.signature)
+
+    def _prewarm_browsers(self) -> None:
+        """Start the browser pool in the background while references are pasted."""
+
+        if webdriver is None:
+            return
+        try:
+            count = max(1, int(self.workers_var.get()))
+            timeout_seconds = max(1.0, float(self.timeout_var.get()))
+        except ValueError:
+            return
+        destination = Path(self.path_var.get()).expanduser()
+        headless = self.headless_var.get()
+
+        def prewarm() -> None:
+            try:
+                self._acquire_downloaders(
+                    count, timeout_seconds, headless, destination
+                )
+            except Exception:
+                # The first run reports launch problems when it needs a browser.
+                return
+            if self._closed:
+                for downloader in self.downloaders:
+                    downloader.close()
+            elif not (self.download_thread and self.download_thread.is_alive()):
+                self._update_status("Idle")
+
+        self._prewarm_thread = threading.Thread(target=prewarm, daemon=True)
+        self._prewarm_thread.start()
+
+    def _acquire_downloaders(
+        self,
+        count: int,
+        timeout_seconds: float,
+        headless: bool = False,
+        destination: Optional[Path] = None,
+    ) -> List[PDFDownloader]:
+        """Return ``count`` ready browsers, reusing those left open by earlier runs.
+
+        Browsers that died or were started with a different headless setting are
+        replaced. New browsers download next to ``destination`` when possible.
+        """
+
+        prewarm = self._prewarm_thread
+        if prewarm is not None and prewarm is not threading.current_thread():
+            prewarm.join()
+
+        if (
+            destination is not None
+            and self._browser_dir is not None
+            and destination != self._browser_destination
+        ):
+            # Staging elsewhere would make every final move a cross-device copy;
+            # start over next to the new destination.
+            for downloader in self.downloaders:
+                downloader.close()
+            self.downloaders = []
+            shutil.rmtree(self._browser_dir, ignore_errors=True)
+            self._browser_dir = None
+
+        alive: List[PDFDownloader] = []
+        for downloader in self.downloaders:
+            if downloader.headless == headless and downloader.is_alive():
+                alive.append(downloader)
+            else:
+                downloader.close()
+                shutil.rmtree(downloader.download_dir, ignore_errors=True)
+        self.downloaders = alive
+
+        missing = count - len(self.downloaders)
+        if missing > 0:
+            self._update_status(f"Starting {missing} browser(s)...")
+            if self._browser_dir is None:
+                if destination is not None:
+                    _remove_stale_work_dirs(destination)
+                    self._browser_dir = _make_work_dir(destination)
+                else:
+                    self._browser_dir = Path(tempfile.mkdtemp(prefix="fetch_pdfs_"))
+                self._browser_destination = destination
+            self.downloaders.extend(
+                self._start_downloaders(
+                    missing, self._browser_dir, timeout_seconds, headless
+                )
+            )
+
+        if self._browser_dir is not None:
+            try:
+                os.utime(self._browser_dir)
+            except OSError:
+                pass
+
+        active = self.downloaders[:count]
+        for downloader in active:
+            downloader.download_timeout = max(1.0, float(timeout_seconds))
+            downloader.clear_download_dir()
+        return active
+
+    def _start_downloaders(
+        self, count: int, temp_dir: Path, timeout_seconds: float, headless: bool = False
+    ) -> List[PDFDownloader]:
+        """Launch ``count`` browsers in parallel, each with its own download folder."""
+
+        worker_dirs = [
+            Path(tempfile.mkdtemp(prefix="worker_", dir=temp_dir)) for _ in range(count)
+        ]
+
+        with ThreadPoolExecutor(max_workers=count) as executor:
+            futures = [
+                executor.submit(
+                    PDFDownloader,
+                    worker_dir,
+                    self._prompt_challenge,
+                    download_timeout=timeout_seconds,
+                    headless=headless,
+                )
+                for worker_dir in worker_dirs
+            ]
+
+        downloaders: List[PDFDownloader] = []
+        first_error: Optional[Exception] = None
+        for future in futures:
+            try:
+                downloaders.append(future.result())
+            except Exception as exc:
+                first_error = first_error or exc
+        if not downloaders and first_error is not None:
+            raise first_error
+        return downloaders
+
+    def _download_with_pool(
+        self,
+        pool: "queue.Queue[PDFDownloader]",
+        task: ReferenceTask,
+        destination: Path,
+    ) -> DownloadResult:
+        downloader = pool.get()
+        try:
+            with self._skip_scope() as skip_event:
+                return downloader.download(
+                    task.reference,
+                    task.output_name,
+                    destination,
+                    skip_event=skip_event,
+                )
+        except Exception as exc:
+            # One broken attempt must not abort the run; the others carry on.
+            return DownloadResult(task.reference, False, str(exc) or type(exc).__name__)
+        finally:
+            if not downloader.is_alive():
+                # The window was closed or the session crashed; give the
+                # remaining references a working browser.
+                try:
+                    downloader.restart()
+                except Exception:
+                    pass
+            pool.put(downloader)
+
+    def _restart_browsers(self) -> None:
+        """Close the kept-alive browsers so the next run starts fresh ones."""
+
+        if self.download_thread and self.download_thread.is_alive():
+            return
+        if self._prewarm_thread and self._prewarm_thread.is_alive():
+            return
+        closing, self.downloaders = self.downloaders, []
+        if not closing:
+            return
+        self._set_status_now("Browsers will restart on the next download.")
+
+        def close_all() -> None:
+            for downloader in closing:
+                downloader.close()
+                shutil.rmtree(downloader.download_dir, ignore_errors=True)
+
+        threading.Thread(target=close_all, daemon=True).start()
+
+    def _on_close(self) -> None:
+        # Browsers still launching in the background close themselves.
+        self._closed = True
+        self._cancel_pending_attempts()
+        for downloader in self.downloaders:
+            downloader.close()
+        self.downloaders = []
+        if self._browser_dir is not None:
+            shutil.rmtree(self._browser_dir, ignore_errors=True)
+        self.destroy()
+
+    @staticmethod
+    def _resolve_duplicates(
+        tasks: List[ReferenceTask], final_results: List[Optional[DownloadResult]]
+    ) -> None:
+        """Copy each original entry's final outcome onto its duplicates."""
+
+        for task in tasks:
+            if task.duplicate_of is None:
+                continue
+            original_result = (
+                final_results[task.duplicate_of - 1]
+                if 0 <= task.duplicate_of - 1 < len(final_results)
+                else None
+            )
+            if isinstance(original_result, DownloadResult):
+                if original_result.success:
+                    message = (
+                        f"Duplicate of entry {task.duplicate_of}; reused downloaded file"
+                    )
+                else:
+                    reason = (
+                        f"{original_result.message}"
+                        if original_result.message
+                        else "original attempt failed"
+                    )
+                    message = (
+                        f"Duplicate of entry {task.duplicate_of}; original failed: {reason}"
+                    )
+                final_results[task.index - 1] = DownloadResult(
+                    task.reference,
+                    original_result.success,
+                    message,
+                    original_result.destination,
+                    used_filename=original_result.used_filename,
+                )
+            else:
+                final_results[task.index - 1] = DownloadResult(
+                    task.reference,
+                    False,
+                    f"Duplicate of entry {task.duplicate_of}; original result unavailable",
+                )
+
+    @contextmanager
+    def _skip_scope(self) -> Iterator[threading.Event]:
+        """Register a skip flag for one attempt so the Skip button can reach it."""
+
+        event = threading.Event()
+        with self._skip_lock:
+            if self._cancel_event.is_set():
+                event.set()
+            self._active_skip_events.add(event)
+        try:
+            yield event
+        finally:
+            with self._skip_lock:
+                self._active_skip_events.discard(event)
+
     def _run_manual_fallback(
         self,
         tasks: List[ReferenceTask],
@@ -1369,23 +3011,76 @@ class App(tk.Tk):
             self._update_status("Manual fallback could not start (downloads folder missing).")
             return []
 
-        manual_successes: List[ReferenceTask] = []
-        total = len(tasks)
-        for idx, task, previous in pending:
-            self._update_status(
-                f"Manual fallback for {task.index}/{total}: {task.preview}"
-            )
-            manual_result = self._perform_manual_download(
-                task,
+        # Look the targets up while the confirmation is open and while earlier
+        # references are being downloaded by hand; each is awaited only when due.
+        lookup_executor = ThreadPoolExecutor(
+            max_workers=min(MANUAL_LOOKUP_WORKERS, len(pending))
+        )
+        target_futures = [
+            lookup_executor.submit(resolve_manual_targets, task.reference)
+            for _idx, task, _previous in pending
+        ]
+        try:
+            return self._run_manual_downloads(
+                pending,
+                target_futures,
+                len(tasks),
+                final_results,
                 destination,
                 downloads_dir,
                 timeout_seconds,
-                previous.message,
             )
-            self._skip_event.clear()
+        finally:
+            lookup_executor.shutdown(wait=False, cancel_futures=True)
+
+    def _run_manual_downloads(
+        self,
+        pending: List[tuple[int, ReferenceTask, DownloadResult]],
+        target_futures: List[Future],
+        total: int,
+        final_results: List[Optional[DownloadResult]],
+        destination: Path,
+        downloads_dir: Path,
+        timeout_seconds: float,
+    ) -> List[ReferenceTask]:
+        if not self._prompt_manual_confirmation(
+            [task for _idx, task, _previous in pending], downloads_dir, timeout_seconds
+        ):
+            for idx, _task, previous in pending:
+                final_results[idx] = DownloadResult(
+                    previous.target,
+                    False,
+                    self._append_manual_note(
+                        previous.message, "Manual fallback skipped by user"
+                    ),
+                )
+            return []
+
+        # PDFs already in the folder are never claimed. Taken once: a claimed file
+        # is moved out, so only failed attempts need a fresh look (a download that
+        # lands after its timeout must not be credited to the next reference).
+        existing_names = _pdf_names(downloads_dir)
+        manual_successes: List[ReferenceTask] = []
+        for (idx, task, previous), targets in zip(pending, target_futures):
+            self._update_status(
+                f"Manual fallback for {task.index}/{total}: {task.preview}"
+            )
+            with self._skip_scope() as skip_event:
+                manual_result = self._perform_manual_download(
+                    task,
+                    destination,
+                    downloads_dir,
+                    timeout_seconds,
+                    previous.message,
+                    skip_event,
+                    targets.result(),
+                    existing_names,
+                )
             final_results[idx] = manual_result
             if manual_result.success:
                 manual_successes.append(task)
+            else:
+                existing_names |= _pdf_names(downloads_dir)
 
         if manual_successes:
             self._update_status("Manual fallback completed.")
@@ -1399,26 +3094,14 @@ class App(tk.Tk):
         downloads_dir: Path,
         timeout_seconds: float,
         previous_message: str,
+        skip_event: threading.Event,
+        targets: Optional[ManualTargets] = None,
+        existing_names: Optional[set[str]] = None,
     ) -> DownloadResult:
-        proceed: bool
-        if self._manual_prompt_acknowledged:
-            proceed = True
-        else:
-            proceed = self._prompt_manual_confirmation(
-                task, downloads_dir, timeout_seconds
-            )
-            if proceed:
-                self._manual_prompt_acknowledged = True
-        if not proceed:
-            return DownloadResult(
-                task.reference,
-                False,
-                self._append_manual_note(
-                    previous_message, "Manual fallback skipped by user"
-                ),
-            )
-
-        targets = resolve_manual_targets(task.reference)
+        if existing_names is None:
+            existing_names = _pdf_names(downloads_dir)
+        if targets is None:
+            targets = resolve_manual_targets(task.reference)
         auto_notes: List[str] = []
         opened = False
 
@@ -1459,7 +3142,6 @@ class App(tk.Tk):
                 previous_message, "; ".join(auto_notes)
             )
 
-        existing_files = {p.resolve() for p in downloads_dir.glob("*.pdf")}
         self._update_status(
             f"Waiting for manual download in {downloads_dir}: {task.preview}"
         )
@@ -1467,9 +3149,9 @@ class App(tk.Tk):
         try:
             manual_file = wait_for_manual_pdf(
                 downloads_dir,
-                existing_files,
+                existing_names,
                 timeout_seconds,
-                skip_event=self._skip_event,
+                skip_event=skip_event,
             )
         except SkipRequested:
             return DownloadResult(
@@ -1524,9 +3206,10 @@ class App(tk.Tk):
             if sanitized:
                 preferred_name = sanitized
 
-        destination_path = _dedupe_path(destination / f"{preferred_name}.pdf")
         try:
-            shutil.move(str(manual_file), destination_path)
+            destination_path = _move_to_unique_path(
+                manual_file, destination / f"{preferred_name}.pdf"
+            )
         except OSError as exc:
             return DownloadResult(
                 task.reference,
@@ -1545,19 +3228,26 @@ class App(tk.Tk):
         )
 
     def _prompt_manual_confirmation(
-        self, task: ReferenceTask, downloads_dir: Path, timeout_seconds: float
+        self, tasks: List[ReferenceTask], downloads_dir: Path, timeout_seconds: float
     ) -> bool:
+        """Ask once per run whether to hand the remaining references to the user."""
+
         event = threading.Event()
         decision = {"proceed": False}
 
         def prompt() -> None:
+            shown = "\n".join(f"- {task.preview}" for task in tasks[:10])
+            if len(tasks) > 10:
+                shown += f"\n...and {len(tasks) - 10} more"
             message = (
-                "Automated attempts were unable to fetch this reference:\n\n"
-                f"{task.reference}\n\n"
-                "Click Yes to open the search in your default browser so you can "
-                "download the PDF manually. Save the PDF into the folder:\n"
+                "Automated attempts were unable to fetch "
+                f"{len(tasks)} reference(s):\n\n"
+                f"{shown}\n\n"
+                "Click Yes to open each search in your default browser so you can "
+                "download the PDFs manually, one at a time. Save each PDF into the folder:\n"
                 f"{downloads_dir}\n\n"
-                f"The app will watch for a new PDF there for up to {int(timeout_seconds)} seconds."
+                f"The app will watch for a new PDF there for up to {int(timeout_seconds)} "
+                "seconds per reference."
             )
             decision["proceed"] = messagebox.askyesno(
                 "Manual download required", message
@@ -1573,41 +3263,101 @@ class App(tk.Tk):
         return f"{previous}; {note}" if previous else note
 
     def _update_status(self, text: str) -> None:
-        def updater() -> None:
+        """Queue ``text`` for the status bar; safe to call from worker threads.
+
+        Updates are coalesced so parallel workers trigger at most one Tk repaint
+        every ``STATUS_FLUSH_MS`` milliseconds.
+        """
+
+        with self._status_lock:
+            flush_scheduled = self._pending_status is not None
+            self._pending_status = text
+        if not flush_scheduled:
+            self.after(self.STATUS_FLUSH_MS, self._flush_status)
+
+    def _flush_status(self) -> None:
+        with self._status_lock:
+            text, self._pending_status = self._pending_status, None
+        if text is not None:
             self.status_var.set(text)
 
-        self.after(0, updater)
+    def _set_status_now(self, text: str) -> None:
+        """Show ``text`` immediately, dropping any queued worker update (Tk thread)."""
+
+        with self._status_lock:
+            self._pending_status = None
+        self.status_var.set(text)
 
     def _finish(self, summary_lines: Iterable[str]) -> None:
         def finish_ui() -> None:
             self.download_button.config(state=tk.NORMAL)
+            self.restart_button.config(state=tk.NORMAL)
             self.skip_button.config(state=tk.DISABLED)
-            self.status_var.set("Done")
+            self.cancel_button.config(state=tk.DISABLED)
+            self._set_status_now("Done")
             messagebox.showinfo("Download summary", "\n".join(summary_lines))
 
         self.after(0, finish_ui)
 
-    def _prompt_challenge(self, message: str) -> None:
-        event = threading.Event()
+    def _prompt_challenge(
+        self, message: str, skip_event: Optional[threading.Event] = None
+    ) -> None:
+        """Show ``message`` and block until it is confirmed or ``skip_event`` is set."""
+
+        def skipped() -> bool:
+            return skip_event is not None and skip_event.is_set()
 
         def show_message() -> None:
             browser_label = self._current_browser_label or "your browser"
-            self.status_var.set(
+            self._set_status_now(
                 f"Waiting for manual verification in {browser_label} (complete the challenge and click OK)..."
             )
             messagebox.showinfo("Manual verification required", message)
-            event.set()
+            self._challenge_dialog_closed.set()
 
-        self.after(0, show_message)
-        event.wait()
+        # Parallel browsers may hit verification together; show one dialog at a time.
+        # Both waits wake up regularly so Skip is not held up by an open dialog.
+        while not self._challenge_prompt_lock.acquire(timeout=0.5):
+            if skipped():
+                return
+        try:
+            # A skipped attempt leaves its dialog open; rather than stacking a
+            # second one, its OK stands in for this attempt's confirmation too.
+            if self._challenge_dialog_closed.is_set():
+                self._challenge_dialog_closed.clear()
+                self.after(0, show_message)
+            while not self._challenge_dialog_closed.wait(0.5):
+                if skipped():
+                    return
+        finally:
+            self._challenge_prompt_lock.release()
         self._update_status("Resuming downloads...")
 
     def _request_skip(self) -> None:
         if not (self.download_thread and self.download_thread.is_alive()):
             return
-        self._skip_event.set()
+        with self._skip_lock:
+            active_events = list(self._active_skip_events)
+        for event in active_events:
+            event.set()
         self._update_status("Skip requested. Moving to the next reference...")
 
+    def _request_cancel(self) -> None:
+        if not (self.download_thread and self.download_thread.is_alive()):
+            return
+        self._cancel_pending_attempts()
+        self.cancel_button.config(state=tk.DISABLED)
+        self._update_status("Cancel requested. Skipping the remaining references...")
+
+    def _cancel_pending_attempts(self) -> None:
+        """Skip the running attempts and every attempt that has not started yet."""
+
+        with self._skip_lock:
+            self._cancel_event.set()
+            active_events = list(self._active_skip_events)
+        for event in active_events:
+            event.set()
+
 
 if __name__ == "__main__":
     app = App()